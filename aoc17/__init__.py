@@ -0,0 +1,9 @@
+'''
+Author:     Griffin Melnick, melnick.griffin@gmail.com
+File:       __init__.py
+Purpose:    Advent of Code 2017, unified runner package
+            Imports the day modules in 'solutions' once and runs their parts
+            in a single process.  Invoked with 'python -m aoc17'.
+'''
+
+from aoc17.runner import DAYS, PARTS, Result, load_day, run, run_part, tasks
@@ -0,0 +1,306 @@
+'''
+Author:     Griffin Melnick, melnick.griffin@gmail.com
+File:       __main__.py
+Purpose:    Advent of Code 2017, command line entry point
+            USAGE: python -m aoc17 run [days] [parts] [--all] [--jobs N]
+                       [--no-cache] [--profile [--interval S]] [--mem]
+                       [--progress S [--metrics FILE]]
+                   python -m aoc17 imports [days] [--top N]
+                   python -m aoc17 generate day size [--seed N] [--output FILE]
+                   python -m aoc17 serve [--socket PATH]
+                   python -m aoc17 client day [parts] [--input FILE]
+                   python -m aoc17 batch day inputs [parts] [--jobs N]
+                       [--format csv|json] [--output FILE]
+                   python -m aoc17 complexity [cases] [--scale F] [--repeat N]
+                   python -m aoc17 diff [pairs] [--trials N] [--scale F]
+            'days' is a list such as '1,3,5-9' (default all), and 'parts' is
+            'a', 'b', or 'ab' (default 'ab').  With '--jobs N' the parts are
+            spread over N processes, slowest (by previous runs) first.
+            Answers are reused while the input and solver are unchanged.
+            '--profile' writes cProfile and sampled collapsed stacks per part,
+            '--mem' reports peak traced memory and top allocation sites.
+            '--progress S' reports the rate and ETA of long loops every S
+            seconds.
+            'batch' solves one day for every file in a directory or glob.
+            'complexity' fits the growth of selected solvers on n to 8n sized
+            synthetic inputs against the expected big-O.
+            'diff' checks fast engines against their reference functions on
+            random inputs and records the speedups.
+'''
+
+import argparse
+import functools
+import os
+import sys
+
+# subcommand modules are imported in their branches of 'main()', so a plain
+# 'run' does not pay for multiprocessing, cProfile, or socketserver.
+from aoc17 import answers, history, runner
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+Day list parser.
+:param:     spec, string such as '1,3,5-9'.
+:return:    sorted list of ints.
+:throws:    argparse.ArgumentTypeError, if spec contains illegal day.
+'''
+def parse_days(spec):
+    days = set()
+    try:
+        for block in spec.split(','):
+            if ( '-' in block ):
+                lo, hi = [ int(x) for x in block.split('-') ]
+                days.update( range(lo, (hi + 1)) )
+            else:
+                days.add( int(block) )
+    except ValueError:
+        raise argparse.ArgumentTypeError( "Illegal day list '{0}'.".format(spec) )
+
+    if ( not days.issubset(runner.DAYS) ):
+        raise argparse.ArgumentTypeError( "Days must be between 1 and 25." )
+    return sorted( days )
+
+
+'''
+Part list parser.
+:param:     spec, string with 'a' and/or 'b'.
+:return:    tuple of parts in order.
+:throws:    argparse.ArgumentTypeError, if spec contains illegal part.
+'''
+def parse_parts(spec):
+    spec = spec.strip().lower()
+    if ( not spec or set(spec) - set(runner.PARTS) ):
+        raise argparse.ArgumentTypeError( "Parts must be 'a', 'b', or 'ab'." )
+    return tuple( part for part in runner.PARTS if part in spec )
+
+
+'''
+Command line parser builder.
+:return:    argparse.ArgumentParser with all subcommands.
+'''
+def build_parser():
+    parser = argparse.ArgumentParser( prog = "aoc17" )
+    commands = parser.add_subparsers( dest = "command", required = True )
+
+    run = commands.add_parser( "run", help = "run days in one process" )
+    run.add_argument( "days", nargs = '?', type = parse_days,
+        default = list(runner.DAYS), help = "days such as '1,3,5-9'" )
+    run.add_argument( "parts", nargs = '?', type = parse_parts,
+        default = runner.PARTS, help = "'a', 'b', or 'ab'" )
+    run.add_argument( "--all", action = "store_true",
+        help = "run every day, ignoring the day list" )
+    run.add_argument( "--jobs", type = int, default = 1,
+        help = "worker processes, scheduled longest-first (default 1)" )
+    run.add_argument( "--no-cache", action = "store_true",
+        help = "recompute answers even if input and solver are unchanged" )
+    run.add_argument( "--profile", action = "store_true",
+        help = "profile each part (runs serially, ignores the answer cache)" )
+    run.add_argument( "--profile-dir",
+        help = "directory for .pstats and .collapsed files (default "
+        ".aoc17/profiles)" )
+    run.add_argument( "--interval", type = float, default = 0.001,
+        help = "seconds between stack samples when profiling (default 0.001)" )
+    run.add_argument( "--mem", action = "store_true",
+        help = "report peak traced memory and top allocation sites per part" )
+    run.add_argument( "--top", type = int, default = 5,
+        help = "allocation sites listed per part with --mem (default 5)" )
+    run.add_argument( "--progress", type = float, metavar = "S",
+        help = "report long loops' rate and ETA every S seconds" )
+    run.add_argument( "--metrics", metavar = "FILE",
+        help = "append progress reports to FILE as JSON lines, not stderr" )
+
+    times = commands.add_parser( "imports", help = "report cold import times" )
+    times.add_argument( "days", nargs = '?', type = parse_days,
+        default = list(runner.DAYS), help = "days such as '1,3,5-9'" )
+    times.add_argument( "--top", type = int, default = 3,
+        help = "heaviest dependencies listed per day" )
+
+    gen = commands.add_parser( "generate", help = "write a synthetic input" )
+    gen.add_argument( "day", type = int, choices = runner.DAYS )
+    gen.add_argument( "size", type = int, help = "see aoc17.generate.SIZES" )
+    gen.add_argument( "--seed", type = int, default = 0 )
+    gen.add_argument( "--width", type = int, help = "columns, day 2 only" )
+    gen.add_argument( "--output", help = "file to write (default stdout)" )
+
+    serve = commands.add_parser( "serve", help = "start the warm solver daemon" )
+    serve.add_argument( "--socket", help = "socket path (default .aoc17/solver.sock)" )
+
+    client = commands.add_parser( "client", help = "ask the daemon for answers" )
+    client.add_argument( "day", type = int, choices = runner.DAYS )
+    client.add_argument( "parts", nargs = '?', type = parse_parts,
+        default = runner.PARTS, help = "'a', 'b', or 'ab'" )
+    client.add_argument( "--input", help = "input file in place of inputs/dayNN.txt" )
+    client.add_argument( "--socket", help = "socket path (default .aoc17/solver.sock)" )
+    client.add_argument( "--shutdown", action = "store_true",
+        help = "stop the daemon instead of solving" )
+
+    multi = commands.add_parser( "batch", help = "solve one day for many inputs" )
+    multi.add_argument( "day", type = int, choices = runner.DAYS )
+    multi.add_argument( "inputs", help = "directory or glob of input files" )
+    multi.add_argument( "parts", nargs = '?', type = parse_parts,
+        default = runner.PARTS, help = "'a', 'b', or 'ab'" )
+    multi.add_argument( "--jobs", type = int, default = 1,
+        help = "worker processes (default 1)" )
+    multi.add_argument( "--format", choices = ( "csv", "json" ),
+        help = "answer format (default from --output suffix, else csv)" )
+    multi.add_argument( "--output", help = "file to write (default stdout)" )
+
+    fit = commands.add_parser( "complexity", help = "fit solver scaling exponents" )
+    fit.add_argument( "cases", nargs = '*', help = "cases such as "
+        "'day17.gen_spinlock' (default all)" )
+    fit.add_argument( "--scale", type = float, default = 1.0,
+        help = "factor applied to every base size (default 1)" )
+    fit.add_argument( "--repeat", type = int, default = 3,
+        help = "runs per size, fastest kept (default 3)" )
+    fit.add_argument( "--seed", type = int, default = 0 )
+
+    check = commands.add_parser( "diff", help = "check fast engines against references" )
+    check.add_argument( "pairs", nargs = '*', help = "pairs such as "
+        "'day17.track_zero' (default all)" )
+    check.add_argument( "--trials", type = int, default = 5,
+        help = "random inputs per pair (default 5)" )
+    check.add_argument( "--scale", type = float, default = 1.0,
+        help = "factor applied to every input size (default 1)" )
+    check.add_argument( "--seed", type = int, default = 0 )
+
+    return parser
+
+
+'''
+Entry point.
+:param:     argv, list of arguments (defaults to sys.argv).
+:return:    exit status, 1 if any part raised.
+'''
+def main(argv=None):
+    args = build_parser().parse_args( argv )
+
+    if ( args.command == "run" ):
+        days = list( runner.DAYS ) if ( args.all ) else args.days
+        if ( args.jobs < 1 ):
+            sys.stderr.write( "USAGE: --jobs must be at least 1\n" )
+            return 2
+
+        # read by 'solutions/progress.py', and inherited by worker processes
+        if ( args.progress ):
+            os.environ["AOC17_PROGRESS"] = str( args.progress )
+        if ( args.metrics ):
+            os.environ["AOC17_METRICS"] = os.path.abspath( args.metrics )
+
+        if ( args.profile ):
+            from aoc17 import profiler
+            solve = functools.partial( profiler.profile_part,
+                out_dir = args.profile_dir or profiler.PROFILES, interval = args.interval )
+            results = runner.run( days, args.parts, solve = solve )
+            return int( any(result.error for result in results) )
+
+        if ( args.mem ):
+            from aoc17 import memory
+            solve = functools.partial( memory.trace_part, top = args.top )
+            results = runner.run( days, args.parts, solve = solve )
+            return int( any(result.error for result in results) )
+
+        solve = functools.partial( answers.solve, use_cache = not args.no_cache )
+        if ( args.jobs == 1 ):
+            results = runner.run( days, args.parts, solve = solve )
+        else:
+            from aoc17 import scheduler
+            results = scheduler.run_parallel( days, args.parts, args.jobs,
+                history.load_timings(), solve = solve )
+
+        history.record_timings( results )
+        answers.record_answers( results )
+        return int( any(result.error for result in results) )
+
+    elif ( args.command == "imports" ):
+        from aoc17 import imports
+        totals = imports.report( args.days, args.top )
+        return int( any(total is None for total in totals.values()) )
+
+    elif ( args.command == "serve" ):
+        from aoc17 import daemon
+        try:
+            daemon.serve( args.socket or daemon.SOCKET )
+        except RuntimeError as err:
+            sys.stderr.write( "{0}\n".format(err) )
+            return 1
+
+    elif ( args.command == "client" ):
+        from aoc17 import daemon
+        socket = args.socket or daemon.SOCKET
+        try:
+            if ( args.shutdown ):
+                daemon.request( { "command": "shutdown" }, socket )
+                return 0
+            results = [ daemon.solve( args.day, part, args.input, socket )
+                for part in args.parts ]
+        except (OSError, RuntimeError) as err:
+            sys.stderr.write( "daemon: {0}\n".format(err) )
+            return 1
+
+        for result in results:
+            sys.stdout.write( runner.format_result(result) + "\n" )
+        return int( any(result.error for result in results) )
+
+    elif ( args.command == "batch" ):
+        from aoc17 import batch
+        paths = batch.collect( args.inputs )
+        if ( not paths ):
+            sys.stderr.write( "batch: no input files match '{0}'\n".format(
+                args.inputs) )
+            return 1
+        if ( args.jobs < 1 ):
+            sys.stderr.write( "USAGE: --jobs must be at least 1\n" )
+            return 2
+
+        fmt = args.format
+        if ( fmt is None ):
+            fmt = "json" if ( (args.output or "").endswith(".json") ) else "csv"
+
+        rows = batch.run_batch( args.day, args.parts, paths, args.jobs )
+        if ( args.output ):
+            with open( args.output, 'w', newline = "" ) as f:
+                batch.write_rows( rows, f, fmt )
+        else:
+            batch.write_rows( rows, sys.stdout, fmt )
+        return int( any(row["error"] for row in rows) )
+
+    elif ( args.command == "complexity" ):
+        from aoc17 import complexity
+        try:
+            slopes = complexity.report( args.cases, args.scale, args.repeat,
+                args.seed )
+        except ValueError as err:
+            sys.stderr.write( "complexity: {0}\n".format(err) )
+            return 2
+        return int( any(k is None for k in slopes.values()) )
+
+    elif ( args.command == "diff" ):
+        from aoc17 import differential
+        try:
+            records = differential.report( args.pairs, args.trials, args.scale,
+                args.seed )
+        except ValueError as err:
+            sys.stderr.write( "diff: {0}\n".format(err) )
+            return 2
+        return int( any(record is None or record["mismatches"]
+            for record in records.values()) )
+
+    elif ( args.command == "generate" ):
+        from aoc17 import generate
+        options = {} if ( args.width is None ) else { "width": args.width }
+        if ( args.output ):
+            generate.write( args.day, args.size, args.seed, args.output, **options )
+        else:
+            sys.stdout.write( generate.generate(args.day, args.size, args.seed,
+                **options) )
+
+    return 0
+
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+if ( __name__ == "__main__" ):
+    sys.exit( main() )
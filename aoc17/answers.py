@@ -0,0 +1,140 @@
+'''
+Author:     Griffin Melnick, melnick.griffin@gmail.com
+File:       answers.py
+Purpose:    Advent of Code 2017, answer memoization
+            Stores every (day, part) answer in '.aoc17/answers.json' keyed on
+            the SHA-256 of the day's input file and of its solver source, so
+            unchanged days are answered without recomputing them.
+'''
+
+import hashlib
+import os
+import time
+
+from aoc17 import history, runner
+
+ANSWERS = os.path.join( history.STATE, "answers.json" )
+INPUTS = os.path.join( runner.ROOT, "inputs" )
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+File digest method.
+:param:     path, path to file.
+:return:    SHA-256 hex digest of the file, or of nothing if it is missing.
+'''
+def file_digest(path):
+    digest = hashlib.sha256()
+    try:
+        with open( path, 'rb' ) as f:
+            digest.update( f.read() )
+    except OSError:
+        pass
+
+    return digest.hexdigest()
+
+
+'''
+Input digest for a day.
+:param:     day, int from 1 to 25.
+:return:    SHA-256 hex digest of 'inputs/dayNN.txt'.
+'''
+def input_digest(day):
+    return file_digest( os.path.join(INPUTS, "day{0:02d}.txt".format(day)) )
+
+
+'''
+Solver digest for a day.  Covers the module's own source and every module
+from 'solutions' it imports (e.g. 'day10' for day 14).
+:param:     day, int from 1 to 25.
+:return:    SHA-256 hex digest of the solver sources.
+'''
+def source_digest(day):
+    module = runner.load_day( day )
+    sources = { module.__name__: module.__file__ }
+    for name, value in vars( module ).items():
+        path = getattr( value, "__file__", None )
+        if ( path and os.path.dirname(os.path.abspath(path)) == runner.SOLUTIONS ):
+            sources[ value.__name__ ] = path
+
+    digest = hashlib.sha256()
+    for name in sorted( sources ):
+        digest.update( name.encode() + b'\0' )
+        digest.update( file_digest(sources[name]).encode() )
+
+    return digest.hexdigest()
+
+
+'''
+Answer store reader.
+:param:     path, path to answers file.
+:return:    dictionary with task keys mapped to stored entries.
+'''
+def load_answers(path=ANSWERS):
+    return history.read_json( path )
+
+
+'''
+Cached answer lookup.
+:param:     day, int from 1 to 25.
+            part, 'a' or 'b'.
+            path, path to answers file.
+:return:    cached Result, or None if missing or either digest changed.
+'''
+def lookup(day, part, path=ANSWERS):
+    start = time.perf_counter()
+    entry = load_answers( path ).get( runner.task_key(day, part) )
+    if ( entry is None ):
+        return None
+
+    try:
+        if ( entry["input"] != input_digest(day) or
+                entry["source"] != source_digest(day) ):
+            return None
+    except ImportError:
+        return None
+
+    return runner.Result( day, part, entry["output"],
+        time.perf_counter() - start, None, True )
+
+
+'''
+Memoized solver, usable anywhere the runner takes a 'solve' function.
+:param:     day, int from 1 to 25.
+            part, 'a' or 'b'.
+            use_cache, False to always recompute.
+:return:    Result, cached or freshly computed.
+'''
+def solve(day, part, use_cache=True):
+    if ( use_cache ):
+        result = lookup( day, part )
+        if ( result is not None ):
+            return result
+
+    return runner.run_part( day, part )
+
+
+'''
+Answer store writer.  Called once by the parent process, after any workers
+finish, so the file only has a single writer.
+:param:     results, iterable of Results from the runner.
+            path, path to answers file.
+:modifies:  answers file at path.
+:effects:   stores every error free, freshly computed answer with the digests
+            it was computed under.
+'''
+def record_answers(results, path=ANSWERS):
+    answers = load_answers( path )
+    for result in results:
+        if ( result.error is not None or result.cached ):
+            continue
+
+        answers[ runner.task_key(result.day, result.part) ] = {
+            "input": input_digest( result.day ),
+            "source": source_digest( result.day ),
+            "output": result.output,
+            "seconds": result.seconds,
+        }
+
+    history.write_json( answers, path )
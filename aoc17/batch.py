@@ -0,0 +1,132 @@
+'''
+Author:     Griffin Melnick, melnick.griffin@gmail.com
+File:       batch.py
+Purpose:    Advent of Code 2017, batch multi-input mode
+            Solves one day for many puzzle inputs in a single run.  Each
+            worker imports the day module once, parses every input through
+            the day's 'read_*' method, and hands the parsed structure straight
+            to 'part_a' / 'part_b'.  Answers are written as CSV or JSON, one
+            row per input and part.
+'''
+
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import functools
+import glob
+import inspect
+import json
+import os
+import sys
+
+from aoc17 import runner
+
+FIELDS = ( "input", "day", "part", "output", "seconds", "error" )
+FORMATS = ( "csv", "json" )
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+Input collection method.
+:param:     spec, directory (every file directly inside it) or glob pattern.
+:return:    sorted list of input file paths.
+'''
+def collect(spec):
+    if ( os.path.isdir(spec) ):
+        spec = os.path.join( spec, "*" )
+    return sorted( path for path in glob.glob(spec) if os.path.isfile(path) )
+
+
+'''
+Reader lookup.
+:param:     module, imported 'dayNN' module.
+:return:    the module's 'read_*' function.
+:throws:    RuntimeError, if the module does not have exactly one reader.
+'''
+def reader(module):
+    found = [ func for name, func in sorted( vars(module).items() )
+        if name.startswith("read_") and inspect.isfunction(func) ]
+    if ( len(found) != 1 ):
+        raise RuntimeError( "Day module '{0}' does not read an input file.".format(
+            module.__name__) )
+    return found[0]
+
+
+'''
+Single input solver, run inside a worker.  The input is read once; when both
+parts are asked for, the second read is served from the loader's in-memory
+cache as a fresh copy, since parts may modify what they are given.
+:param:     day, int from 1 to 25.
+            parts, iterable of 'a' and/or 'b'.
+            path, input file to solve.
+:return:    list of row dictionaries with the FIELDS keys, one per part.
+'''
+def solve_input(day, parts, path):
+    rows = []
+    for part in parts:
+        try:
+            module = runner.load_day( day )
+            func = getattr( module, "part_" + part, None )
+            if ( func is not None and not inspect.signature(func).parameters ):
+                raise RuntimeError( "Day {0} part '{1}' does not take an input.".format(
+                    day, part ) )
+
+            read = reader( module )
+            if ( "part" in inspect.signature(read).parameters ):
+                data = read( part, path )
+            else:
+                data = read( path )
+        except Exception as err:
+            result = runner.Result( day, part, "", 0.0, "{0}: {1}".format(
+                type(err).__name__, err ) )
+        else:
+            result = runner.run_part( day, part, data )
+
+        row = { "input": path }
+        row.update( (field, getattr(result, field)) for field in FIELDS[1:] )
+        rows.append( row )
+
+    return rows
+
+
+'''
+Batch runner.
+:param:     day, int from 1 to 25.
+            parts, iterable of 'a' and/or 'b'.
+            paths, list of input files.
+            jobs, number of worker processes, 1 to solve in this process.
+:return:    list of row dictionaries in the order of paths.
+'''
+def run_batch(day, parts, paths, jobs=1):
+    solve = functools.partial( solve_input, day, tuple(parts) )
+    rows = []
+    if ( jobs == 1 ):
+        for path in paths:
+            rows.extend( solve(path) )
+        return rows
+
+    chunk = max( 1, len(paths) // (jobs * 4) )
+    with ProcessPoolExecutor( max_workers = jobs ) as pool:
+        for found in pool.map( solve, paths, chunksize = chunk ):
+            rows.extend( found )
+    return rows
+
+
+'''
+Answer writer.
+:param:     rows, list of row dictionaries from 'run_batch()'.
+            out, stream to write to.
+            fmt, 'csv' or 'json'.
+:throws:    ValueError, if fmt is not one of FORMATS.
+'''
+def write_rows(rows, out=sys.stdout, fmt="csv"):
+    if ( fmt == "csv" ):
+        writer = csv.DictWriter( out, FIELDS, lineterminator = "\n" )
+        writer.writeheader()
+        writer.writerows( rows )
+    elif ( fmt == "json" ):
+        json.dump( rows, out, indent = 2 )
+        out.write( "\n" )
+    else:
+        raise ValueError( "Illegal format '{0}', must be one of {1}.".format(
+            fmt, ", ".join(FORMATS)) )
@@ -0,0 +1,160 @@
+'''
+Author:     Griffin Melnick, melnick.griffin@gmail.com
+File:       complexity.py
+Purpose:    Advent of Code 2017, empirical complexity report
+            Times selected solver functions on synthetic inputs of size n, 2n,
+            4n, and 8n, fits the slope of log(time) against log(size), and
+            prints the fitted exponent next to the one expected from reading
+            the code.  Only the function itself is timed, not parsing.
+'''
+
+from collections import namedtuple
+import io
+import math
+import random
+import string
+import sys
+import time
+
+from aoc17 import generate, runner
+
+Case = namedtuple( "Case", [ "name", "day", "func", "expected", "base", "prepare" ] )
+
+STEPS = 4
+MARGIN = 0.25
+PHRASES = 4
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+Day 4 arguments: a few passphrases of 'size' distinct eight letter words with
+no anagrams, so every pair of words in a phrase gets compared.
+'''
+def prepare_day04(module, size, rng):
+    phrases = [ [ ''.join( rng.choice(string.ascii_lowercase) for _ in range(8) )
+        for _ in range(size) ] for _ in range(PHRASES) ]
+    return ( phrases, )
+
+
+'''
+Day 12 arguments: the pipe graph built from a generated input of 'size'
+programs.
+'''
+def prepare_day12(module, size, rng):
+    text = generate.generate( 12, size, rng.randrange(1 << 30) )
+    return ( module.build_graph( module.parse_pipes(io.StringIO(text)) ), )
+
+
+'''
+Day 17 arguments: a generated step and 'size' values to insert.
+'''
+def prepare_day17(module, size, rng):
+    text = generate.generate( 17, 400, rng.randrange(1 << 30) )
+    return ( module.parse_step( io.StringIO(text) ), size )
+
+
+CASES = [
+    Case( "day04.count_no_anagrams", 4, "count_no_anagrams", 2.0, 50, prepare_day04 ),
+    Case( "day12.count_connects", 12, "count_connects", 2.0, 200, prepare_day12 ),
+    Case( "day17.gen_spinlock", 17, "gen_spinlock", 2.0, 20000, prepare_day17 ),
+    Case( "day17.track_zero", 17, "track_zero", 1.0, 200000, prepare_day17 ),
+]
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+Least squares slope of log(seconds) against log(size).
+:param:     points, list of (size, seconds) with at least two sizes.
+:return:    fitted exponent k, for time growing as size ** k.
+'''
+def fit_slope(points):
+    xs = [ math.log(size) for size, _ in points ]
+    ys = [ math.log( max(seconds, 1e-9) ) for _, seconds in points ]
+    mx, my = sum( xs ) / len( xs ), sum( ys ) / len( ys )
+    num = sum( (x - mx) * (y - my) for x, y in zip(xs, ys) )
+    den = sum( (x - mx) ** 2 for x in xs )
+    return num / den
+
+
+'''
+Exponent formatting helper.
+:param:     k, exponent.
+:return:    string such as 'O(n)' or 'O(n^1.93)'.
+'''
+def big_o(k):
+    text = "{0:.2f}".format( k )
+    if ( text == "1.00" ):
+        return "O(n)"
+    return "O(n^{0})".format( text.replace(".00", "") )
+
+
+'''
+Case timer.
+:param:     case, Case to time.
+            scale, factor applied to the case's base size.
+            repeat, runs per size, the fastest of which is kept.
+            seed, seed for the synthetic inputs.
+:return:    list of (size, seconds) for sizes n, 2n, 4n, and 8n.
+:throws:    ImportError, if the day (or a library it needs) cannot be imported.
+'''
+def measure(case, scale=1.0, repeat=3, seed=0):
+    module = runner.load_day( case.day )
+    func = getattr( module, case.func )
+    rng = random.Random( seed )
+
+    points = []
+    for step in range( STEPS ):
+        size = max( 1, int(case.base * scale) ) << step
+        args = case.prepare( module, size, rng )
+        best = float( "inf" )
+        for _ in range( repeat ):
+            start = time.perf_counter()
+            func( *args )
+            best = min( best, time.perf_counter() - start )
+        points.append( (size, best) )
+
+    return points
+
+
+'''
+Report writer.
+:param:     names, case names to run, or None for all of CASES.
+            scale, factor applied to every base size.
+            repeat, runs per size.
+            seed, seed for the synthetic inputs.
+            out, stream to write the report to.
+:return:    dictionary with case names mapped to fitted exponents, or None
+            for cases that failed.
+:throws:    ValueError, if a name is not in CASES.
+'''
+def report(names=None, scale=1.0, repeat=3, seed=0, out=sys.stdout):
+    known = { case.name: case for case in CASES }
+    for name in names or []:
+        if ( name not in known ):
+            raise ValueError( "Unknown case '{0}', choose from {1}.".format( name,
+                ", ".join(known) ) )
+    chosen = [ known[name] for name in names ] if ( names ) else CASES
+
+    slopes = {}
+    for case in chosen:
+        try:
+            points = measure( case, scale, repeat, seed )
+        except Exception as err:
+            out.write( "{0:<26}  ERROR {1}: {2}\n".format( case.name,
+                type(err).__name__, err ) )
+            slopes[case.name] = None
+            continue
+
+        k = fit_slope( points )
+        slopes[case.name] = k
+        flag = "  <- worse than expected" if ( k > case.expected + MARGIN ) else ""
+        line = "{0:<26}  expected {1:<9}  fitted {2:<11}{3}".format( case.name,
+            big_o(case.expected), big_o(k), flag )
+        out.write( line.rstrip() + "\n" )
+        for size, seconds in points:
+            out.write( "    n={0:<10} {1:10.4f}s\n".format(size, seconds) )
+        out.flush()
+
+    return slopes
@@ -0,0 +1,174 @@
+'''
+Author:     Griffin Melnick, melnick.griffin@gmail.com
+File:       daemon.py
+Purpose:    Advent of Code 2017, warm solver daemon
+            A long-lived process that keeps every 'dayNN' module, networkx,
+            numpy, and the loader's parsed inputs in memory, answering
+            (day, part, input path) requests over a Unix domain socket.  Each
+            request and response is one line of JSON.
+'''
+
+import json
+import os
+import socket
+import socketserver
+import sys
+
+from aoc17 import history, runner
+
+SOCKET = os.path.join( history.STATE, "solver.sock" )
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+Request answering method.
+:param:     request, dictionary with 'day', 'part', and optional absolute
+            'input'.
+:return:    dictionary with the Result fields, ready for JSON.
+'''
+def answer(request):
+    try:
+        day, part = int( request["day"] ), str( request["part"] )
+        if ( part not in runner.PARTS ):
+            raise ValueError( "Illegal part '{0}'.".format(part) )
+        path = request.get( "input" )
+        if ( path is not None and not os.path.isabs(path) ):
+            raise ValueError( "Input path '{0}' is not absolute.".format(path) )
+        runner.load_day( day )
+    except (KeyError, TypeError, ValueError) as err:
+        return { "error": "{0}: {1}".format( type(err).__name__, err ) }
+    except ImportError:
+        pass
+
+    # 'solutions' is on sys.path once any day has been loaded
+    import loader
+    with loader.redirected( "day{0:02d}.txt".format(day), path ):
+        result = runner.run_part( day, part )
+
+    return result._asdict()
+
+
+class Handler(socketserver.StreamRequestHandler):
+
+    '''
+    Connection handler, answering one JSON request per line until the client
+    closes the connection or sends {"command": "shutdown"}.
+    '''
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads( line )
+            except ValueError:
+                response = { "error": "ValueError: request is not JSON" }
+            else:
+                command = request.get( "command" ) if ( isinstance(request, dict) ) else None
+                if ( command == "shutdown" ):
+                    self.wfile.write( b'{"ok": true}\n' )
+                    self.server.shutting_down = True
+                    return
+                elif ( command == "ping" ):
+                    response = { "ok": True, "pid": os.getpid() }
+                elif ( isinstance(request, dict) ):
+                    response = answer( request )
+                else:
+                    response = { "error": "ValueError: request is not an object" }
+
+            self.wfile.write( (json.dumps(response) + "\n").encode() )
+            self.wfile.flush()
+
+
+class Server(socketserver.UnixStreamServer):
+
+    '''
+    Single threaded server; connections are handled one at a time, which
+    keeps the loader's input redirection safe.  'shutting_down' is set by the
+    handler when a shutdown request arrives.
+    '''
+    shutting_down = False
+
+
+'''
+Warm-up method.
+:return:    list of days whose modules could be imported.
+:effects:   imports every day module, plus networkx and numpy if installed.
+'''
+def warm():
+    loaded = []
+    for day in runner.DAYS:
+        try:
+            runner.load_day( day )
+            loaded.append( day )
+        except ImportError:
+            pass
+
+    for name in ( "networkx", "numpy" ):
+        try:
+            __import__( name )
+        except ImportError:
+            pass
+
+    return loaded
+
+
+'''
+Daemon entry point; blocks until a shutdown request arrives.
+:param:     path, path of the Unix socket to listen on.
+            out, stream to write status lines to.
+:throws:    RuntimeError, if another daemon is already listening on path.
+'''
+def serve(path=SOCKET, out=sys.stderr):
+    if ( os.path.exists(path) ):
+        try:
+            request( { "command": "ping" }, path )
+        except OSError:
+            os.unlink( path )
+        else:
+            raise RuntimeError( "A daemon is already listening on '{0}'.".format(path) )
+
+    os.makedirs( os.path.dirname(os.path.abspath(path)), exist_ok = True )
+    loaded = warm()
+    with Server( path, Handler ) as server:
+        out.write( "serving {0} day modules on {1}\n".format(len(loaded), path) )
+        out.flush()
+        try:
+            while not server.shutting_down:
+                server.handle_request()
+        finally:
+            os.unlink( path )
+
+
+'''
+Client method.
+:param:     message, dictionary to send.
+            path, path of the daemon's Unix socket.
+:return:    dictionary decoded from the daemon's response.
+:throws:    OSError, if the daemon cannot be reached.
+'''
+def request(message, path=SOCKET):
+    with socket.socket( socket.AF_UNIX, socket.SOCK_STREAM ) as sock:
+        sock.connect( path )
+        sock.sendall( (json.dumps(message) + "\n").encode() )
+        with sock.makefile( 'rb' ) as f:
+            return json.loads( f.readline() )
+
+
+'''
+Client solving method, the replacement for running 'dayNN.py' directly.
+:param:     day, int from 1 to 25.
+            part, 'a' or 'b'.
+            input_path, other input file to solve, or None for the default.
+            A relative path is taken from this process's working directory,
+            not the daemon's.
+            path, path of the daemon's Unix socket.
+:return:    Result answered by the daemon.
+:throws:    OSError, if the daemon cannot be reached.
+            RuntimeError, if the daemon rejected the request.
+'''
+def solve(day, part, input_path=None, path=SOCKET):
+    if ( input_path is not None ):
+        input_path = os.path.abspath( input_path )
+    response = request( { "day": day, "part": part, "input": input_path }, path )
+    if ( "day" not in response ):
+        raise RuntimeError( response.get("error", "malformed response") )
+    return runner.Result( **response )
@@ -0,0 +1,424 @@
+'''
+Author:     Griffin Melnick, melnick.griffin@gmail.com
+File:       differential.py
+Purpose:    Advent of Code 2017, differential harness
+            Runs each fast engine against the reference function it replaces
+            on random synthetic inputs, checks that both give the same answer,
+            and records the measured speedup in '.aoc17/speedups.json'.
+'''
+
+from collections import namedtuple
+import copy
+import io
+import os
+import random
+import sys
+import time
+
+from aoc17 import complexity, generate, history, runner
+
+SPEEDUPS = os.path.join( history.STATE, "speedups.json" )
+SCRATCH = os.path.join( history.STATE, "differential" )
+
+Pair = namedtuple( "Pair", [ "name", "day", "reference", "fast", "size", "prepare" ] )
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+Day 1 arguments: a generated captcha of 'size' digits.
+'''
+def prepare_day01(module, size, rng):
+    text = generate.generate( 1, size, rng.randrange(1 << 30) )
+    return ( module.parse_captcha( io.StringIO(text) ), )
+
+
+'''
+Day 1 reference: the part 'a' and part 'b' sums from the scanning methods.
+'''
+def captcha_scans(module, captcha):
+    return ( module.next_sum(captcha), module.half_sum(captcha) )
+
+
+'''
+Day 1 fast path: the same two entries of the every offset table.
+'''
+def captcha_offsets(module, captcha):
+    sums = module.offset_sums( captcha )
+    return ( int( sums[1 % len(captcha)] ), int( sums[len(captcha) // 2] ) )
+
+
+'''
+Day 1 file arguments: a generated captcha of 'size' digits, written to a
+scratch file for engines that read from disk.
+'''
+def prepare_day01_file(module, size, rng):
+    os.makedirs( SCRATCH, exist_ok = True )
+    path = os.path.join( SCRATCH, "day01.txt" )
+    with open( path, 'w' ) as f:
+        f.write( generate.generate(1, size, rng.randrange(1 << 30)) )
+    return ( path, )
+
+
+'''
+Day 1 file reference: the whole file read in, then both scanning methods.
+'''
+def captcha_file_scans(module, path):
+    with open( path, 'r' ) as f:
+        return captcha_scans( module, module.parse_captcha(f) )
+
+
+'''
+Day 1 streaming path: both parts from the memory-mapped file.
+'''
+def captcha_stream(module, path):
+    return ( module.stream_sum(path, 'a'), module.stream_sum(path, 'b') )
+
+
+'''
+Day 2 arguments: a few generated rows, each 'size' values wide.
+'''
+def prepare_day02(module, size, rng):
+    text = generate.generate( 2, 4, rng.randrange(1 << 30), width = size )
+    return ( module.convert( module.parse_spreadsheet(io.StringIO(text)) ), )
+
+
+'''
+Day 2 file arguments: 'size' generated rows cut to random widths, some
+empty, written to a scratch file.
+'''
+def prepare_day02_file(module, size, rng):
+    os.makedirs( SCRATCH, exist_ok = True )
+    path = os.path.join( SCRATCH, "day02.txt" )
+    text = generate.generate( 2, size, rng.randrange(1 << 30), width = 40 )
+    with open( path, 'w' ) as f:
+        for line in text.splitlines():
+            f.write( '\t'.join( line.split()[ :rng.randint(0, 40) ] ) + "\n" )
+    return ( path, )
+
+
+'''
+Day 2 file reference: the whole file parsed and converted, then checksummed.
+'''
+def spreadsheet_checksum(module, path):
+    with open( path, 'r' ) as f:
+        return module.total_checksum( module.convert(module.parse_spreadsheet(f)) )
+
+
+'''
+Day 3 arguments: a thousand random squares up to 'size'.
+'''
+def prepare_day03(module, size, rng):
+    return ( [ rng.randint(1, size) for _ in range(1000) ], )
+
+
+'''
+Day 3 reference: walks the spiral square by square up to the largest query.
+'''
+def spiral_walk_dists(module, nums):
+    wanted, last, found = set( nums ), max( nums ), {}
+    x, y, dx, dy = 0, 0, 1, 0
+    square, side = 1, 1
+    while True:
+        for _ in range( 2 ):
+            for _ in range( side ):
+                if ( square in wanted ):
+                    found[square] = abs( x ) + abs( y )
+                if ( square >= last ):
+                    return [ found[num] for num in nums ]
+                x, y, square = x + dx, y + dy, square + 1
+            dx, dy = -dy, dx
+        side += 1
+
+
+'''
+Day 3 stress test reference: a fresh simulation for every query.
+'''
+def stress_scans(module, nums):
+    return [ module.first_larger(num) for num in nums ]
+
+
+'''
+Day 3 stress test fast path: one table, extended once and searched per query.
+'''
+def stress_table(module, nums):
+    table = module.StressTable()
+    return [ table.first_above(num) for num in nums ]
+
+
+'''
+Day 4 arguments: 'size' generated passphrases, some with repeats or anagrams.
+'''
+def prepare_day04(module, size, rng):
+    text = generate.generate( 4, size, rng.randrange(1 << 30) )
+    return ( module.parse_phrases( io.StringIO(text) ), )
+
+
+'''
+Day 4 reference: both parts from the pairwise counting methods.
+'''
+def phrase_scans(module, phrases):
+    return ( module.count_no_dups(phrases), module.count_no_anagrams(phrases) )
+
+
+'''
+Day 4 fast path: both parts from the single set pass.
+'''
+def phrase_signatures(module, phrases):
+    return ( module.count_valid(phrases, 'a'), module.count_valid(phrases, 'b') )
+
+
+'''
+Day 4 file arguments: 'size' generated passphrases, written to a scratch file.
+'''
+def prepare_day04_file(module, size, rng):
+    os.makedirs( SCRATCH, exist_ok = True )
+    path = os.path.join( SCRATCH, "day04.txt" )
+    with open( path, 'w' ) as f:
+        f.write( generate.generate(4, size, rng.randrange(1 << 30)) )
+    return ( path, )
+
+
+'''
+Day 4 file reference: both parts counted over the streamed file.
+'''
+def phrase_stream(module, path):
+    return ( module.count_valid(module.stream_phrases(path), 'a'),
+        module.count_valid(module.stream_phrases(path), 'b') )
+
+
+'''
+Day 4 sharded path: both parts counted by worker processes over mmap shards.
+'''
+def phrase_shards(module, path):
+    return ( module.count_sharded(path, 'a'), module.count_sharded(path, 'b') )
+
+
+'''
+Day 5 arguments: 'size' generated jump offsets.
+'''
+def prepare_day05(module, size, rng):
+    text = generate.generate( 5, size, rng.randrange(1 << 30) )
+    return ( module.parse_instructions( io.StringIO(text) ), )
+
+
+'''
+Day 5 reference: steps and final offsets from both list based methods.
+'''
+def maze_lists(module, instructions):
+    plain, strange = list( instructions ), list( instructions )
+    return ( module.follow_plain(plain), plain, module.follow_strange(strange),
+        strange )
+
+
+'''
+Day 5 fast path: steps and final offsets from the array engine.
+'''
+def maze_arrays(module, instructions):
+    plain, plain_offsets = module.jump_engine( instructions, 'a' )
+    strange, strange_offsets = module.jump_engine( instructions, 'b' )
+    return ( plain, list(plain_offsets), strange, list(strange_offsets) )
+
+
+'''
+Day 5 part 'b' reference: steps and final offsets from 'follow_strange()'.
+'''
+def maze_strange(module, instructions):
+    return ( module.follow_strange(instructions), instructions )
+
+
+'''
+Day 5 part 'b' fast path: steps and final offsets with settled blocks skipped.
+'''
+def maze_settled(module, instructions):
+    steps, offsets = module.settled_engine( instructions )
+    return ( steps, list(offsets) )
+
+
+'''
+Day 6 arguments: 'size' generated memory banks.
+'''
+def prepare_day06(module, size, rng):
+    text = generate.generate( 6, size, rng.randrange(1 << 30) )
+    return ( module.parse_banks( io.StringIO(text) ), )
+
+
+'''
+Day 6 reference: the original balancing loop, handing out one block at a time
+and remembering every configuration seen.
+'''
+def banks_stepwise(module, banks):
+    cycles, history = 0, {}
+    while tuple( banks ) not in history:
+        history[ tuple(banks) ] = cycles
+        maximum = max( banks )
+        curr = banks.index( maximum )
+        banks[ curr ] = 0
+        while maximum > 0:
+            curr = ( curr + 1 ) % len( banks )
+            banks[ curr ] += 1
+            maximum -= 1
+        cycles += 1
+
+    return ( cycles, cycles - history[ tuple(banks) ] )
+
+
+'''
+Day 6 low-memory path: Brent's cycle finding, reported as 'find_duplicate()' does.
+'''
+def banks_brent(module, banks):
+    first, length = module.find_cycle( banks )
+    return ( first + length, length )
+
+
+'''
+Day 17 reference: the value after '0' in the fully built spinlock buffer.
+'''
+def spinlock_after_zero(module, step, moment):
+    c_buffer = module.gen_spinlock( step, moment )
+    return c_buffer[ (c_buffer.index(0) + 1) % len(c_buffer) ]
+
+
+PAIRS = [
+    Pair( "day01.offset_sums", 1, captcha_scans, captcha_offsets, 200000,
+        prepare_day01 ),
+    Pair( "day01.stream_sum", 1, captcha_file_scans, captcha_stream, 200000,
+        prepare_day01_file ),
+    Pair( "day02.sieve_row_sum", 2,
+        lambda module, sheet: module.even_row_sum( sheet ),
+        lambda module, sheet: module.sieve_row_sum( sheet ), 2000, prepare_day02 ),
+    Pair( "day02.vector_row_sum", 2,
+        lambda module, sheet: module.even_row_sum( sheet ),
+        lambda module, sheet: module.vector_row_sum( sheet ), 2000, prepare_day02 ),
+    Pair( "day02.masked_checksum", 2, spreadsheet_checksum,
+        lambda module, path: module.masked_checksum( module.stream_blocks(path) ),
+        20000, prepare_day02_file ),
+    Pair( "day03.spiral_dists", 3, spiral_walk_dists,
+        lambda module, nums: module.spiral_dists( nums ).tolist(), 1000000,
+        prepare_day03 ),
+    Pair( "day03.first_above", 3, stress_scans, stress_table, 10 ** 12,
+        prepare_day03 ),
+    Pair( "day04.count_valid", 4, phrase_scans, phrase_signatures, 20000,
+        prepare_day04 ),
+    Pair( "day04.count_valid_wide", 4, phrase_scans, phrase_signatures, 300,
+        complexity.prepare_day04 ),
+    Pair( "day04.count_sharded", 4, phrase_stream, phrase_shards, 400000,
+        prepare_day04_file ),
+    Pair( "day05.jump_engine", 5, maze_lists, maze_arrays, 300, prepare_day05 ),
+    Pair( "day05.settled_engine", 5, maze_strange, maze_settled, 300,
+        prepare_day05 ),
+    Pair( "day06.find_duplicate", 6, banks_stepwise,
+        lambda module, banks: module.find_duplicate( banks ), 16, prepare_day06 ),
+    Pair( "day06.find_cycle", 6, banks_stepwise, banks_brent, 16, prepare_day06 ),
+    Pair( "day17.track_zero", 17, spinlock_after_zero,
+        lambda module, step, moment: module.track_zero( step, moment ),
+        20000, complexity.prepare_day17 ),
+]
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+Single trial.  Each side gets its own deep copy of the arguments, since
+engines are free to modify their input.
+:param:     pair, Pair to check.
+            module, imported 'dayNN' module.
+            args, tuple of arguments from the pair's prepare function.
+:return:    (reference answer, fast answer, reference seconds, fast seconds).
+'''
+def trial(pair, module, args):
+    answers, seconds = [], []
+    for side in ( pair.reference, pair.fast ):
+        copied = copy.deepcopy( args )
+        start = time.perf_counter()
+        answers.append( side(module, *copied) )
+        seconds.append( time.perf_counter() - start )
+
+    return answers[0], answers[1], seconds[0], seconds[1]
+
+
+'''
+Pair checker.
+:param:     pair, Pair to check.
+            trials, number of random inputs.
+            scale, factor applied to the pair's size.
+            seed, seed of the first trial; trial i uses seed + i.
+:return:    dictionary with 'trials', 'mismatches', 'first_mismatch',
+            'reference' and 'fast' total seconds, and 'speedup'.
+:throws:    ImportError, if the day (or a library it needs) cannot be imported.
+'''
+def check(pair, trials=5, scale=1.0, seed=0):
+    module = runner.load_day( pair.day )
+    record = { "trials": trials, "mismatches": 0, "first_mismatch": None,
+        "reference": 0.0, "fast": 0.0 }
+
+    for i in range( trials ):
+        rng = random.Random( seed + i )
+        limit = max( 1, int(pair.size * scale) )
+        size = rng.randint( max(1, limit // 2), limit )
+        args = pair.prepare( module, size, rng )
+        if ( i == 0 ):
+            # untimed first pass, so lazy imports are not counted as work
+            trial( pair, module, args )
+        expected, found, ref_secs, fast_secs = trial( pair, module, args )
+        record["reference"] += ref_secs
+        record["fast"] += fast_secs
+
+        if ( expected != found ):
+            record["mismatches"] += 1
+            if ( record["first_mismatch"] is None ):
+                record["first_mismatch"] = { "seed": seed + i, "size": size,
+                    "reference": repr(expected), "fast": repr(found) }
+
+    record["speedup"] = record["reference"] / record["fast"] if ( record["fast"] ) \
+        else float( "inf" )
+    return record
+
+
+'''
+Report writer.
+:param:     names, pair names to check, or None for all of PAIRS.
+            trials, number of random inputs per pair.
+            scale, factor applied to every pair's size.
+            seed, seed of the first trial.
+            out, stream to write the report to.
+            path, speedups file, or None to skip recording.
+:return:    dictionary with pair names mapped to their records, or None for
+            pairs that failed to run.
+:throws:    ValueError, if a name is not in PAIRS.
+'''
+def report(names=None, trials=5, scale=1.0, seed=0, out=sys.stdout, path=SPEEDUPS):
+    known = { pair.name: pair for pair in PAIRS }
+    for name in names or []:
+        if ( name not in known ):
+            raise ValueError( "Unknown pair '{0}', choose from {1}.".format( name,
+                ", ".join(known) ) )
+    chosen = [ known[name] for name in names ] if ( names ) else PAIRS
+
+    records = {}
+    for pair in chosen:
+        try:
+            record = check( pair, trials, scale, seed )
+        except Exception as err:
+            out.write( "{0:<26}  ERROR {1}: {2}\n".format( pair.name,
+                type(err).__name__, err ) )
+            records[pair.name] = None
+            continue
+
+        records[pair.name] = record
+        status = "ok" if ( record["mismatches"] == 0 ) else \
+            "MISMATCH {0}/{1}".format( record["mismatches"], record["trials"] )
+        out.write( "{0:<26}  {1:<14}  reference {2:9.4f}s  fast {3:9.4f}s  "
+            "speedup {4:8.2f}x\n".format( pair.name, status, record["reference"],
+            record["fast"], record["speedup"] ) )
+        if ( record["first_mismatch"] is not None ):
+            out.write( "    first mismatch: {0}\n".format( record["first_mismatch"] ) )
+        out.flush()
+
+    if ( path is not None ):
+        stored = history.read_json( path )
+        stored.update( (name, record) for name, record in records.items()
+            if record is not None )
+        history.write_json( stored, path )
+
+    return records
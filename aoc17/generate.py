@@ -0,0 +1,538 @@
+'''
+Author:     Griffin Melnick, melnick.griffin@gmail.com
+File:       generate.py
+Purpose:    Advent of Code 2017, synthetic input generators
+            Builds a valid input for any day at a chosen size, reproducible
+            from a seed, so solvers can be measured well past the size of the
+            checked-in puzzle inputs.  What 'size' counts is listed in SIZES.
+'''
+
+import itertools
+import random
+import string
+
+SIZES = {
+    1: "digits in the captcha",
+    2: "rows (see 'width' for columns)",
+    3: "upper bound of the square number",
+    4: "passphrases",
+    5: "jump offsets",
+    6: "memory banks",
+    7: "programs in the tower",
+    8: "instructions",
+    9: "characters in the stream (approximate)",
+    10: "lengths",
+    11: "steps",
+    12: "programs in the pipe graph",
+    13: "firewall layers",
+    14: "characters in the key",
+    15: "ignored, two start values",
+    16: "dance moves",
+    17: "upper bound of the step",
+    18: "instructions",
+    19: "steps along the path",
+    20: "particles",
+    21: "ignored, one rule per 2x2 and 3x3 pattern",
+    22: "side length of the grid",
+    23: "instructions",
+    24: "components",
+    25: "diagnostic steps",
+}
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+Random lowercase name helper.
+:param:     rng, random.Random.
+            used, set of names already handed out.
+            lo, hi, bounds on the length of the name.
+:return:    new name not in used.
+:modifies:  used
+:effects:   adds the new name.
+'''
+def fresh_name(rng, used, lo=3, hi=8):
+    while True:
+        name = ''.join( rng.choice(string.ascii_lowercase)
+            for _ in range( rng.randint(lo, hi) ) )
+        if ( name not in used ):
+            used.add( name )
+            return name
+
+
+'''
+Prime sieve helper.
+:param:     n, exclusive upper bound.
+:return:    list of primes below n.
+'''
+def primes_below(n):
+    sieve = bytearray( [1] ) * n
+    sieve[ :2 ] = b"\x00\x00"
+    for i in range( 2, int(n ** 0.5) + 1 ):
+        if ( sieve[i] ):
+            sieve[ i*i : n : i ] = bytearray( len(range(i*i, n, i)) )
+    return [ i for i in range(n) if sieve[i] ]
+
+
+'''
+Day 1: one line of digits.
+'''
+def gen_day01(rng, size):
+    return ''.join( rng.choice(string.digits) for _ in range( max(size, 1) ) ) + "\n"
+
+
+'''
+Day 2: tab separated rows.  Every row has exactly one evenly dividing pair:
+fillers are distinct primes above 1000, while the pair is built only from
+primes below 1000, so no filler divides or is divided by anything else.
+'''
+def gen_day02(rng, size, width=16):
+    width = max( width, 2 )
+    fillers = primes_below( max(200000, 30 * width) )
+    fillers = [ p for p in fillers if p > 1000 ]
+    small = primes_below( 1000 )
+
+    rows = []
+    for _ in range( max(size, 1) ):
+        a = 1
+        for _ in range( rng.randint(1, 2) ):
+            a *= rng.choice( small )
+        row = rng.sample( fillers, (width - 2) ) + [ a, a * rng.randint(2, 9) ]
+        rng.shuffle( row )
+        rows.append( '\t'.join( str(x) for x in row ) )
+
+    return '\n'.join( rows ) + "\n"
+
+
+'''
+Day 3: a single square number.
+'''
+def gen_day03(rng, size):
+    size = max( size, 2 )
+    return "{0}\n".format( rng.randint(max(2, size // 2), size) )
+
+
+'''
+Day 4: passphrases of lowercase words, some with repeats or anagrams.
+'''
+def gen_day04(rng, size):
+    lines = []
+    for _ in range( max(size, 1) ):
+        words = [ ''.join( rng.choice(string.ascii_lowercase)
+            for _ in range( rng.randint(2, 7) ) ) for _ in range( rng.randint(5, 10) ) ]
+        roll = rng.random()
+        if ( roll < 0.2 ):
+            words.append( rng.choice(words) )
+        elif ( roll < 0.4 ):
+            word = list( rng.choice(words) )
+            rng.shuffle( word )
+            words.append( ''.join(word) )
+        lines.append( ' '.join(words) )
+
+    return '\n'.join( lines ) + "\n"
+
+
+'''
+Day 5: jump offsets, mostly backwards like the puzzle input.
+'''
+def gen_day05(rng, size):
+    return '\n'.join( str( rng.randint(-i, 2) ) for i in range( max(size, 1) ) ) + "\n"
+
+
+'''
+Day 6: one line of bank sizes.
+'''
+def gen_day06(rng, size):
+    return ' '.join( str( rng.randint(0, 15) ) for _ in range( max(size, 2) ) ) + "\n"
+
+
+'''
+Day 7: a balanced tower with exactly one program whose weight is off.
+Subtrees are built bottom up; a child lighter than its siblings has its own
+weight raised, which balances it without touching anything beneath it.
+'''
+def gen_day07(rng, size):
+    used, weights, children = set(), {}, {}
+
+    def build(budget):
+        name = fresh_name( rng, used )
+        weights[name] = rng.randint( 10, 99 )
+        children[name] = []
+        if ( budget < 4 ):
+            return name, weights[name]
+
+        k = rng.randint( 3, min(5, budget - 1) )
+        cuts = sorted( rng.sample( range(1, budget - 1), (k - 1) ) )
+        budgets = [ hi - lo for lo, hi in zip( [0] + cuts, cuts + [budget - 1] ) ]
+
+        totals = {}
+        for sub in budgets:
+            child, total = build( sub )
+            children[name].append( child )
+            totals[child] = total
+
+        top = max( totals.values() )
+        for child, total in totals.items():
+            weights[child] += ( top - total )
+
+        return name, weights[name] + k * top
+
+    root, _ = build( max(size, 4) )
+    parents = [ name for name in children if children[name] ]
+    odd = rng.choice( children[ rng.choice(parents) ] )
+    weights[odd] += rng.randint( 1, 9 )
+
+    names = list( weights )
+    rng.shuffle( names )
+    lines = []
+    for name in names:
+        line = "{0} ({1})".format( name, weights[name] )
+        if ( children[name] ):
+            line += " -> " + ", ".join( children[name] )
+        lines.append( line )
+
+    return '\n'.join( lines ) + "\n"
+
+
+'''
+Day 8: conditional register instructions.
+'''
+def gen_day08(rng, size):
+    size = max( size, 1 )
+    used = set()
+    regs = [ fresh_name(rng, used, 1, 3) for _ in range( max(4, size // 50) ) ]
+    ops = [ ">", "<", ">=", "<=", "==", "!=" ]
+
+    lines = []
+    for _ in range( size ):
+        lines.append( "{0} {1} {2} if {3} {4} {5}".format( rng.choice(regs),
+            rng.choice( ("inc", "dec") ), rng.randint(-1000, 1000),
+            rng.choice(regs), rng.choice(ops), rng.randint(-10, 10) ) )
+
+    return '\n'.join( lines ) + "\n"
+
+
+'''
+Day 9: nested groups with garbage and '!' cancels.  Built iteratively with a
+depth counter so large sizes do not hit the recursion limit.
+'''
+def gen_day09(rng, size):
+    out, depth, state = [ '{' ], 1, "open"
+    budget = max( size, 2 )
+    while depth > 0:
+        winding = ( len(out) >= budget )
+        closing = ( winding or (depth > 1 and rng.random() < 0.1) )
+        if ( state == "item" or (state == "open" and closing) ):
+            if ( state == "item" and not winding and (depth == 1 or rng.random() < 0.6) ):
+                out.append( ',' )
+                state = "comma"
+            else:
+                out.append( '}' )
+                depth -= 1
+                state = "item"
+
+        elif ( not winding and rng.random() < 0.5 ):
+            out.append( '{' )
+            depth += 1
+            state = "open"
+
+        else:
+            out.append( '<' )
+            for _ in range( rng.randint(0, 8) ):
+                if ( rng.random() < 0.2 ):
+                    out.append( '!' + rng.choice("!<>{}ab,") )
+                else:
+                    out.append( rng.choice("abcdeiou{}<'\",") )
+            out.append( '>' )
+            state = "item"
+
+    return ''.join( out ) + "\n"
+
+
+'''
+Day 10: comma separated lengths no longer than the 256 element list.
+'''
+def gen_day10(rng, size):
+    return ','.join( str( rng.randint(0, 255) ) for _ in range( max(size, 1) ) ) + "\n"
+
+
+'''
+Day 11: comma separated hex steps.
+'''
+def gen_day11(rng, size):
+    dirs = ( "n", "ne", "se", "s", "sw", "nw" )
+    return ','.join( rng.choice(dirs) for _ in range( max(size, 1) ) ) + "\n"
+
+
+'''
+Day 12: an undirected pipe graph with roughly one and a half links per
+program; unlinked programs pipe to themselves like in the puzzle.
+'''
+def gen_day12(rng, size):
+    size = max( size, 1 )
+    links = [ set() for _ in range(size) ]
+    for _ in range( (3 * size) // 4 ):
+        a, b = rng.randrange(size), rng.randrange(size)
+        links[a].add( b )
+        links[b].add( a )
+
+    lines = []
+    for i, connects in enumerate( links ):
+        connects = sorted( connects ) or [ i ]
+        lines.append( "{0} <-> {1}".format( i, ", ".join( str(x) for x in connects ) ) )
+
+    return '\n'.join( lines ) + "\n"
+
+
+'''
+Day 13: firewall layers with scanner ranges of at least two.  A delay is
+picked first and each layer only gets a range whose scanner is away from the
+top when that delay reaches it, so part 'b' always has an answer.
+'''
+def gen_day13(rng, size):
+    delay = rng.randrange( 100000 )
+    lines, layer = [], 0
+    for _ in range( max(size, 1) ):
+        ranges = [ r for r in (2, 3, 4, 4, 6, 6, 8, 8, 10, 12, 14)
+            if (delay + layer) % (2 * (r - 1)) != 0 ]
+        if ( not ranges ):
+            ranges = [ (delay + layer) // 2 + 2 ]
+        lines.append( "{0}: {1}".format( layer, rng.choice(ranges) ) )
+        layer += rng.randint( 1, 3 )
+
+    return '\n'.join( lines ) + "\n"
+
+
+'''
+Day 14: a lowercase key string.
+'''
+def gen_day14(rng, size):
+    return ''.join( rng.choice(string.ascii_lowercase)
+        for _ in range( max(size, 1) ) ) + "\n"
+
+
+'''
+Day 15: two generator start values.
+'''
+def gen_day15(rng, size):
+    return "Generator A starts with {0}\nGenerator B starts with {1}\n".format(
+        rng.randint(1, 2147483646), rng.randint(1, 2147483646) )
+
+
+'''
+Day 16: spin, exchange, and partner moves over programs 'a' to 'p'.
+'''
+def gen_day16(rng, size):
+    progs = string.ascii_lowercase[ :16 ]
+    moves = []
+    for _ in range( max(size, 1) ):
+        kind = rng.choice( "sxp" )
+        if ( kind == 's' ):
+            moves.append( "s{0}".format( rng.randint(1, 15) ) )
+        elif ( kind == 'x' ):
+            moves.append( "x{0}/{1}".format( *rng.sample(range(16), 2) ) )
+        else:
+            moves.append( "p{0}/{1}".format( *rng.sample(progs, 2) ) )
+
+    return ','.join( moves ) + "\n"
+
+
+'''
+Day 17: a single spinlock step.
+'''
+def gen_day17(rng, size):
+    return "{0}\n".format( rng.randint(1, max(size, 1)) )
+
+
+'''
+Assembly helper shared by days 18 and 23.  Only forward jumps are emitted,
+so every generated program terminates.
+:param:     rng, random.Random.
+            size, number of instructions.
+            ops, list of (name, kind) with kind one of 'reg', 'val', 'pos',
+            or 'jump'.
+            regs, string of register names.
+:return:    list of instruction strings.
+'''
+def gen_asm(rng, size, ops, regs):
+    lines = []
+    for i in range( size ):
+        name, kind = rng.choice( ops )
+        reg = rng.choice( regs )
+        if ( kind == "reg" ):
+            lines.append( "{0} {1}".format(name, reg) )
+        elif ( kind == "pos" ):
+            lines.append( "{0} {1} {2}".format(name, reg, rng.randint(2, 99)) )
+        elif ( kind == "jump" ):
+            lines.append( "{0} {1} {2}".format(name, reg,
+                rng.randint(1, max(1, min(5, size - i)))) )
+        else:
+            arg = rng.choice( regs ) if ( rng.random() < 0.3 ) else rng.randint(-50, 99)
+            lines.append( "{0} {1} {2}".format(name, reg, arg) )
+
+    return lines
+
+
+'''
+Day 18: 'snd' / 'rcv' assembly.
+'''
+def gen_day18(rng, size):
+    ops = [ ("snd", "reg"), ("set", "val"), ("add", "val"), ("mul", "val"),
+        ("mod", "pos"), ("rcv", "reg"), ("jgz", "jump") ]
+    lines = [ "set a {0}".format( rng.randint(1, 99) ), "snd a" ] + \
+        gen_asm( rng, max(size - 3, 1), ops, "abcdefp" ) + [ "rcv a" ]
+    return '\n'.join( lines ) + "\n"
+
+
+'''
+Day 19: a staircase path of '|', '-', '+', and letters with space padding.
+'''
+def gen_day19(rng, size):
+    cells, x, y = {}, 1, 0
+    steps, down = 0, True
+    while steps < max( size, 4 ):
+        length = rng.randint( 2, 6 )
+        dx, dy = (0, 1) if ( down ) else (1, 0)
+        for _ in range( length ):
+            cells[ (x, y) ] = '|' if ( down ) else '-'
+            if ( rng.random() < 0.15 ):
+                cells[ (x, y) ] = rng.choice( string.ascii_uppercase )
+            x, y = x + dx, y + dy
+            steps += 1
+        cells[ (x, y) ] = '+'
+        x, y = x + (1 - dx), y + (1 - dy)
+        down = not down
+        steps += 1
+
+    cells[ (x, y) ] = rng.choice( string.ascii_uppercase )
+    cells[ (1, 0) ] = '|'
+    width, height = x + 3, y + 2
+    rows = [ ''.join( cells.get( (col, row), ' ' ) for col in range(width) )
+        for row in range(height) ]
+    return '\n'.join( rows ) + "\n"
+
+
+'''
+Day 20: particles with position, velocity, and acceleration.
+'''
+def gen_day20(rng, size):
+    vec = lambda bound: ','.join( str( rng.randint(-bound, bound) ) for _ in range(3) )
+    lines = [ "p=<{0}>, v=<{1}>, a=<{2}>".format( vec(3000), vec(100), vec(10) )
+        for _ in range( max(size, 1) ) ]
+    return '\n'.join( lines ) + "\n"
+
+
+'''
+Symmetry helper for day 21.
+:param:     grid, tuple of row strings.
+:return:    set of all rotations and flips of grid.
+'''
+def symmetries(grid):
+    found = set()
+    for g in ( grid, tuple( row[ ::-1 ] for row in grid ) ):
+        for _ in range(4):
+            g = tuple( ''.join(row) for row in zip( *g[ ::-1 ] ) )
+            found.add( g )
+    return found
+
+
+'''
+Day 21: one enhancement rule for every 2x2 and 3x3 pattern up to symmetry.
+'''
+def gen_day21(rng, size):
+    lines = []
+    for n in ( 2, 3 ):
+        seen = set()
+        for bits in itertools.product( ".#", repeat = n * n ):
+            grid = tuple( ''.join( bits[ i*n : (i+1)*n ] ) for i in range(n) )
+            if ( grid in seen ):
+                continue
+            seen.update( symmetries(grid) )
+
+            out = [ ''.join( rng.choice(".#") for _ in range(n + 1) )
+                for _ in range(n + 1) ]
+            lines.append( "{0} => {1}".format( '/'.join(grid), '/'.join(out) ) )
+
+    return '\n'.join( lines ) + "\n"
+
+
+'''
+Day 22: an odd sided grid of clean and infected nodes.
+'''
+def gen_day22(rng, size):
+    side = max( size, 1 ) | 1
+    rows = [ ''.join( rng.choice("..#") for _ in range(side) ) for _ in range(side) ]
+    return '\n'.join( rows ) + "\n"
+
+
+'''
+Day 23: 'set' / 'sub' / 'mul' / 'jnz' assembly.
+'''
+def gen_day23(rng, size):
+    ops = [ ("set", "val"), ("sub", "val"), ("mul", "val"), ("jnz", "jump") ]
+    return '\n'.join( gen_asm( rng, max(size, 1), ops, "abcdefgh" ) ) + "\n"
+
+
+'''
+Day 24: bridge components, at least one with a zero pin port.
+'''
+def gen_day24(rng, size):
+    size = max( size, 1 )
+    pins = max( 8, size // 2 )
+    ports = [ (0, rng.randint(1, pins)) ] + [ (rng.randint(0, pins),
+        rng.randint(0, pins)) for _ in range(size - 1) ]
+    rng.shuffle( ports )
+    return '\n'.join( "{0}/{1}".format(a, b) for a, b in ports ) + "\n"
+
+
+'''
+Day 25: a Turing machine blueprint in the puzzle's format.  The solver has
+its blueprint written into the module, so this is for other consumers.
+'''
+def gen_day25(rng, size):
+    names = "ABCDEF"
+    lines = [ "Begin in state A.",
+        "Perform a diagnostic checksum after {0} steps.".format( max(size, 1) ) ]
+    for name in names:
+        lines += [ "", "In state {0}:".format(name) ]
+        for current in ( 0, 1 ):
+            lines += [ "  If the current value is {0}:".format(current),
+                "    - Write the value {0}.".format( rng.randint(0, 1) ),
+                "    - Move one slot to the {0}.".format( rng.choice(("left", "right")) ),
+                "    - Continue with state {0}.".format( rng.choice(names) ) ]
+
+    return '\n'.join( lines ) + "\n"
+
+
+GENERATORS = { day: globals()[ "gen_day{0:02d}".format(day) ] for day in SIZES }
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+Generator entry point.
+:param:     day, int from 1 to 25.
+            size, what is counted depends on the day, see SIZES.
+            seed, seed for random.Random; equal arguments give equal output.
+            options, extra keyword options (only 'width' for day 2).
+:return:    input file contents as a string.
+:throws:    ValueError, if day is outside of 1 to 25.
+'''
+def generate(day, size, seed=0, **options):
+    if ( day not in GENERATORS ):
+        raise ValueError( "Illegal day {0}, must be 1 to 25.".format(day) )
+
+    return GENERATORS[day]( random.Random(seed), size, **options )
+
+
+'''
+Generator file writer.
+:param:     day, int from 1 to 25.
+            size, see SIZES.
+            seed, seed for random.Random.
+            path, path to write the input to.
+            options, extra keyword options passed to 'generate()'.
+'''
+def write(day, size, seed, path, **options):
+    with open( path, 'w' ) as f:
+        f.write( generate(day, size, seed, **options) )
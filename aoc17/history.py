@@ -0,0 +1,68 @@
+'''
+Author:     Griffin Melnick, melnick.griffin@gmail.com
+File:       history.py
+Purpose:    Advent of Code 2017, timing history
+            Keeps the last successful wall time of every (day, part) in
+            '.aoc17/timings.json' so later runs can schedule longest-first.
+'''
+
+import json
+import os
+
+from aoc17.runner import ROOT, task_key
+
+STATE = os.path.join( ROOT, ".aoc17" )
+TIMINGS = os.path.join( STATE, "timings.json" )
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+JSON reader that tolerates a missing or corrupt file.
+:param:     path, path to JSON file.
+:return:    dictionary from file, or empty dictionary.
+'''
+def read_json(path):
+    try:
+        with open( path, 'r' ) as f:
+            return json.load( f )
+    except (OSError, ValueError):
+        return {}
+
+
+'''
+JSON writer that replaces the file atomically.
+:param:     data, dictionary to write.
+            path, path to JSON file.
+'''
+def write_json(data, path):
+    os.makedirs( os.path.dirname(path), exist_ok = True )
+    tmp = "{0}.{1}.tmp".format( path, os.getpid() )
+    with open( tmp, 'w' ) as f:
+        json.dump( data, f, indent = 2, sort_keys = True )
+        f.write( "\n" )
+    os.replace( tmp, path )
+
+
+'''
+Timing history reader.
+:param:     path, path to timings file.
+:return:    dictionary with task keys mapped to seconds.
+'''
+def load_timings(path=TIMINGS):
+    return read_json( path )
+
+
+'''
+Timing history writer.
+:param:     results, iterable of Results from the runner.
+            path, path to timings file.
+:modifies:  timings file at path.
+:effects:   stores the wall time of every error free, freshly computed result.
+'''
+def record_timings(results, path=TIMINGS):
+    timings = load_timings( path )
+    for result in results:
+        if ( result.error is None and not result.cached ):
+            timings[ task_key(result.day, result.part) ] = result.seconds
+    write_json( timings, path )
@@ -0,0 +1,98 @@
+'''
+Author:     Griffin Melnick, melnick.griffin@gmail.com
+File:       imports.py
+Purpose:    Advent of Code 2017, import-time report
+            Imports each 'dayNN' module in a fresh interpreter under
+            '-X importtime' and reports its self / cumulative cost along with
+            the heaviest modules it pulled in.
+'''
+
+from collections import namedtuple
+import subprocess
+import sys
+
+from aoc17.runner import SOLUTIONS
+
+Timing = namedtuple( "Timing", [ "name", "self_us", "cumulative_us", "depth" ] )
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+Parser for '-X importtime' output.
+:param:     text, stderr of an interpreter run with '-X importtime'.
+:return:    list of Timings in the order they were printed.
+'''
+def parse_importtime(text):
+    timings = []
+    for line in text.splitlines():
+        if ( not line.startswith("import time:") or "[us]" in line ):
+            continue
+
+        try:
+            self_us, cumulative_us, name = line[ len("import time:"): ].split('|')
+            timings.append( Timing( name.strip(), int(self_us),
+                int(cumulative_us), (len(name) - len(name.lstrip()) - 1) // 2 ) )
+        except ValueError:
+            continue
+
+    return timings
+
+
+'''
+Cold import measurement of one day module.
+:param:     day, int from 1 to 25.
+:return:    list of Timings for every module imported by 'dayNN'.
+:throws:    RuntimeError, if the module cannot be imported.
+'''
+def measure(day):
+    name = "day{0:02d}".format( day )
+    proc = subprocess.run( [ sys.executable, "-X", "importtime", "-c",
+        "import " + name ], cwd = SOLUTIONS, capture_output = True, text = True )
+    if ( proc.returncode != 0 ):
+        last = proc.stderr.strip().splitlines()[-1:]
+        raise RuntimeError( last[0] if last else "import failed" )
+
+    # startup imports ('site' etc.) come first, so keep only the block of
+    # nested imports that ends with 'dayNN' itself
+    timings = parse_importtime( proc.stderr )
+    end = max( i for i, timing in enumerate(timings) if timing.name == name )
+    start = end
+    while start > 0 and timings[ (start - 1) ].depth > 0:
+        start -= 1
+
+    return timings[ start : (end + 1) ]
+
+
+'''
+Report writer.
+:param:     days, iterable of ints for days to measure.
+            top, number of heaviest dependencies to list per day.
+            out, stream to write report lines to.
+:return:    dictionary with days mapped to cumulative import time in us, or
+            None if the import failed.
+'''
+def report(days, top=3, out=sys.stdout):
+    out.write( "import time: {0:>10} | {1:>10} | module\n".format(
+        "self [us]", "cumul [us]" ) )
+
+    totals = {}
+    for day in days:
+        try:
+            timings = measure(day)
+        except RuntimeError as err:
+            out.write( "day{0:02d}: ERROR {1}\n".format(day, err) )
+            totals[day] = None
+            continue
+
+        module = timings[-1]
+        totals[day] = module.cumulative_us
+        out.write( "import time: {0:>10} | {1:>10} | {2}\n".format(
+            module.self_us, module.cumulative_us, module.name ) )
+
+        children = [ timing for timing in timings[ :-1 ] if timing.depth == 1 ]
+        for child in sorted( children, key = lambda t: -t.cumulative_us )[ :top ]:
+            out.write( "import time: {0:>10} | {1:>10} |   {2}\n".format(
+                child.self_us, child.cumulative_us, child.name ) )
+
+    return totals
@@ -0,0 +1,135 @@
+'''
+Author:     Griffin Melnick, melnick.griffin@gmail.com
+File:       memory.py
+Purpose:    Advent of Code 2017, per-part memory accounting
+            Runs one part under tracemalloc and reports its peak traced
+            allocation along with the source lines holding the most memory
+            close to that peak.
+'''
+
+import linecache
+import os
+import sys
+import threading
+import tracemalloc
+
+from aoc17 import runner
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+Size formatting helper.
+:param:     size, number of bytes.
+:return:    string such as '12.3 MiB'.
+'''
+def format_size(size):
+    for unit in ( "B", "KiB", "MiB" ):
+        if ( abs(size) < 1024 ):
+            return "{0:.1f} {1}".format( size, unit )
+        size /= 1024
+    return "{0:.1f} GiB".format( size )
+
+
+class PeakWatcher(threading.Thread):
+
+    # ----------------------------------------------------------
+    # Constructors
+
+    '''
+    Default constructor.
+    :param:     interval, seconds between checks of traced memory.
+                growth, fraction traced memory must grow by before a new
+                snapshot replaces the last one.
+    :modifies:  self.snapshot, self.size, self._every, self._growth,
+                self._finished
+    :effects:   initializes watcher, which starts paused until 'start()'.
+    '''
+    def __init__(self, interval=0.01, growth=0.10):
+        super().__init__( daemon = True )
+        self.snapshot, self.size = None, 0
+        self._every = interval
+        self._growth = growth
+        self._finished = threading.Event()
+
+
+    # ----------------------------------------------------------
+    # Modifiers
+
+    '''
+    Watching loop.
+    :modifies:  self.snapshot, self.size
+    :effects:   snapshots the traces whenever traced memory passes the last
+                snapshot by the growth fraction, so the final snapshot is
+                taken close to the peak.
+    '''
+    def run(self):
+        while not self._finished.wait( self._every ):
+            current, _ = tracemalloc.get_traced_memory()
+            if ( current > self.size * (1 + self._growth) ):
+                self.snapshot = tracemalloc.take_snapshot()
+                self.size = current
+
+
+    '''
+    Stop method.
+    :modifies:  self._finished
+    :effects:   ends the watching loop and waits for the thread to exit.
+    '''
+    def stop(self):
+        self._finished.set()
+        self.join()
+
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+Traced runner, usable anywhere the runner takes a 'solve' function.  A
+background PeakWatcher snapshots the traces as memory grows, so the listed
+sites are the ones alive near the peak rather than after the part returns.
+:param:     day, int from 1 to 25.
+            part, 'a' or 'b'.
+            top, number of allocation sites to report.
+            interval, seconds between checks of traced memory.
+            report, stream to write the memory summary to.
+:return:    Result of the traced run.
+'''
+def trace_part(day, part, top=5, interval=0.01, report=sys.stderr):
+    try:
+        runner.load_day( day )
+    except ImportError:
+        pass
+
+    tracemalloc.start()
+    watcher = PeakWatcher( interval )
+    watcher.start()
+    try:
+        result = runner.run_part( day, part )
+        _, peak = tracemalloc.get_traced_memory()
+        watcher.stop()
+        snapshot, at = watcher.snapshot, format_size( watcher.size )
+        if ( snapshot is None ):
+            snapshot, at = tracemalloc.take_snapshot(), "return"
+    finally:
+        watcher.stop()
+        tracemalloc.stop()
+
+    name = runner.task_key( day, part )
+    report.write( "{0}: peak {1}, sites from a snapshot at {2}\n".format( name,
+        format_size(peak), at ) )
+
+    snapshot = snapshot.filter_traces( [
+        tracemalloc.Filter( False, os.path.join(os.path.dirname(__file__), "*") ),
+        tracemalloc.Filter( False, tracemalloc.__file__ ),
+        tracemalloc.Filter( False, threading.__file__ ),
+        tracemalloc.Filter( False, linecache.__file__ ),
+        tracemalloc.Filter( False, "<frozen importlib._bootstrap*>" ),
+    ] )
+    for stat in snapshot.statistics( "lineno" )[ :top ]:
+        frame = stat.traceback[0]
+        report.write( "  {0:>12} in {1:>8} blocks  {2}:{3}\n".format(
+            format_size(stat.size), stat.count, frame.filename, frame.lineno ) )
+    report.flush()
+
+    return result
@@ -0,0 +1,143 @@
+'''
+Author:     Griffin Melnick, melnick.griffin@gmail.com
+File:       profiler.py
+Purpose:    Advent of Code 2017, per-day profiling hook
+            Runs one part under cProfile and, at the same time, samples the
+            running stack from a background thread.  Writes 'dayNNx.pstats'
+            and a flamegraph-compatible 'dayNNx.collapsed' file.
+'''
+
+from collections import Counter
+import cProfile
+import os
+import pstats
+import sys
+import threading
+
+from aoc17 import history, runner
+
+PROFILES = os.path.join( history.STATE, "profiles" )
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+class Sampler(threading.Thread):
+
+    # ----------------------------------------------------------
+    # Constructors
+
+    '''
+    Default constructor.
+    :param:     ident, thread identifier of the thread to sample.
+                interval, seconds between samples.
+                stop_code, code object whose frame ends each stack walk.
+    :modifies:  self.counts, self._sampled, self._every, self._stop_at,
+                self._finished
+    :effects:   initializes sampler, which starts paused until 'start()'.
+    '''
+    def __init__(self, ident, interval, stop_code):
+        super().__init__( daemon = True )
+        self.counts = Counter()
+        self._sampled = ident
+        self._every = interval
+        self._stop_at = stop_code
+        self._finished = threading.Event()
+
+
+    # ----------------------------------------------------------
+    # Modifiers
+
+    '''
+    Sampling loop.
+    :modifies:  self.counts
+    :effects:   adds one count to the current stack of the sampled thread at
+                every interval until 'stop()' is called.
+    '''
+    def run(self):
+        while not self._finished.wait( self._every ):
+            frame = sys._current_frames().get( self._sampled )
+            stack = []
+            while frame is not None and frame.f_code is not self._stop_at:
+                code = frame.f_code
+                stack.append( "{0} ({1}:{2})".format( code.co_name,
+                    os.path.basename(code.co_filename), frame.f_lineno ) )
+                frame = frame.f_back
+
+            if ( stack ):
+                self.counts[ ';'.join( reversed(stack) ) ] += 1
+
+
+    '''
+    Stop method.
+    :modifies:  self._finished
+    :effects:   ends the sampling loop and waits for the thread to exit.
+    '''
+    def stop(self):
+        self._finished.set()
+        self.join()
+
+
+    # ----------------------------------------------------------
+    # Accessors
+
+    '''
+    Hot line accessor.
+    :param:     top, number of lines to return.
+    :return:    list of (frame label, samples) for the most sampled leaves.
+    '''
+    def hot_lines(self, top=5):
+        leaves = Counter()
+        for stack, count in self.counts.items():
+            leaves[ stack.rsplit(';', 1)[-1] ] += count
+        return leaves.most_common( top )
+
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+Profiled runner, usable anywhere the runner takes a 'solve' function.
+:param:     day, int from 1 to 25.
+            part, 'a' or 'b'.
+            out_dir, directory to write profiles to.
+            interval, seconds between stack samples.
+            report, stream to write the profile summary to.
+:return:    Result of the profiled run.
+:modifies:  'dayNNx.pstats' and 'dayNNx.collapsed' in out_dir.
+'''
+def profile_part(day, part, out_dir=PROFILES, interval=0.001, report=sys.stderr):
+    os.makedirs( out_dir, exist_ok = True )
+    name = runner.task_key( day, part )
+
+    try:
+        runner.load_day( day )
+    except ImportError:
+        pass
+
+    profile = cProfile.Profile()
+    sampler = Sampler( threading.get_ident(), interval, profile_part.__code__ )
+    sampler.start()
+    profile.enable()
+    try:
+        result = runner.run_part( day, part )
+    finally:
+        profile.disable()
+        sampler.stop()
+
+    stats_path = os.path.join( out_dir, name + ".pstats" )
+    profile.dump_stats( stats_path )
+
+    collapsed_path = os.path.join( out_dir, name + ".collapsed" )
+    with open( collapsed_path, 'w' ) as f:
+        for stack, count in sorted( sampler.counts.items() ):
+            f.write( "{0} {1}\n".format(stack, count) )
+
+    report.write( "{0}: wrote {1} and {2}\n".format( name, stats_path,
+        collapsed_path ) )
+    stats = pstats.Stats( profile, stream = report )
+    stats.sort_stats( "cumulative" ).print_stats( 10 )
+    for label, count in sampler.hot_lines():
+        report.write( "  hot {0:>8} samples  {1}\n".format(count, label) )
+    report.flush()
+
+    return result
@@ -0,0 +1,138 @@
+'''
+Author:     Griffin Melnick, melnick.griffin@gmail.com
+File:       runner.py
+Purpose:    Advent of Code 2017, in-process runner
+            Loads each 'dayNN' module from the 'solutions' subdirectory once,
+            calls 'part_a' / 'part_b' directly, and times every part.
+'''
+
+from collections import namedtuple
+import contextlib
+import importlib
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.dirname( os.path.dirname( os.path.abspath(__file__) ) )
+SOLUTIONS = os.path.join( ROOT, "solutions" )
+
+DAYS = tuple( range(1, 26) )
+PARTS = ( 'a', 'b' )
+
+Result = namedtuple( "Result", [ "day", "part", "output", "seconds", "error",
+    "cached" ], defaults = [ False ] )
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+Task key used in timing history and JSON results.
+:param:     day, int from 1 to 25.
+            part, 'a' or 'b'.
+:return:    string such as 'day05b'.
+'''
+def task_key(day, part):
+    return "day{0:02d}{1}".format( day, part )
+
+
+'''
+Day module loader.
+:param:     day, int from 1 to 25.
+:return:    imported 'dayNN' module, shared between all calls.
+:throws:    ValueError, if day is outside of 1 to 25.
+'''
+def load_day(day):
+    if ( day not in DAYS ):
+        raise ValueError( "Illegal day {0}, must be 1 to 25.".format(day) )
+
+    if ( SOLUTIONS not in sys.path ):
+        sys.path.insert( 0, SOLUTIONS )
+
+    return importlib.import_module( "day{0:02d}".format(day) )
+
+
+'''
+Task listing method.
+:param:     days, iterable of ints for days to run.
+            parts, iterable of 'a' and/or 'b'.
+:return:    list of (day, part) tuples for parts each module defines.
+            Modules that fail to import keep every part so the failure is
+            reported by 'run_part()'.
+'''
+def tasks(days, parts):
+    found = []
+    for day in days:
+        try:
+            module = load_day(day)
+        except ImportError:
+            module = None
+
+        for part in parts:
+            if ( module is None or hasattr(module, "part_" + part) ):
+                found.append( (day, part) )
+
+    return found
+
+
+'''
+Single part runner.
+:param:     day, int from 1 to 25.
+            part, 'a' or 'b'.
+            data, parsed input handed to the part, or None to let the part
+            read its own input file.
+:return:    Result with printed answer, wall time, and error (or None).
+'''
+def run_part(day, part, data=None):
+    buf, error = io.StringIO(), None
+    start = time.perf_counter()
+    try:
+        func = getattr( load_day(day), "part_" + part, None )
+        if ( func is None ):
+            raise RuntimeError( "Day {0} has no part '{1}'.".format(day, part) )
+
+        with contextlib.redirect_stdout( buf ):
+            if ( data is None ):
+                func()
+            else:
+                func( data )
+    except Exception as err:
+        error = "{0}: {1}".format( type(err).__name__, err )
+    seconds = time.perf_counter() - start
+
+    return Result( day, part, buf.getvalue().strip(), seconds, error )
+
+
+'''
+Result formatting method.
+:param:     result, Result from 'run_part()'.
+:return:    one line string with day, part, time, and answer or error.
+'''
+def format_result(result):
+    text = result.output if ( result.error is None ) else \
+        "ERROR {0}".format( result.error )
+    if ( result.cached ):
+        text += "  (cached)"
+    return "day{0:02d} {1}  {2:10.4f}s  {3}".format( result.day, result.part,
+        result.seconds, text )
+
+
+'''
+Runs every requested part in this process and reports each one.
+:param:     days, iterable of ints for days to run.
+            parts, iterable of 'a' and/or 'b'.
+            out, stream to write report lines to.
+            solve, function taking (day, part) and returning a Result.
+:return:    list of Results in day order.
+'''
+def run(days, parts, out=sys.stdout, solve=run_part):
+    results = []
+    for day, part in tasks(days, parts):
+        result = solve(day, part)
+        out.write( format_result(result) + "\n" )
+        out.flush()
+        results.append( result )
+
+    total = sum( result.seconds for result in results )
+    out.write( "total {0:10.4f}s\n".format(total) )
+    return results
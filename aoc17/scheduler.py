@@ -0,0 +1,66 @@
+'''
+Author:     Griffin Melnick, melnick.griffin@gmail.com
+File:       scheduler.py
+Purpose:    Advent of Code 2017, process-pool scheduler
+            Spreads (day, part) tasks over a ProcessPoolExecutor, submitting
+            the historically slowest tasks first so they do not finish last.
+'''
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import sys
+import time
+
+from aoc17 import runner
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+Longest-first ordering.
+:param:     found, list of (day, part) tuples.
+            timings, dictionary with task keys mapped to seconds.
+:return:    new list sorted by descending historical cost.  Tasks without
+            history go first, since they could be the most expensive.
+'''
+def order_tasks(found, timings):
+    cost = lambda task: timings.get( runner.task_key(*task), float("inf") )
+    return sorted( found, key = lambda task: (-cost(task), task) )
+
+
+'''
+Parallel runner.
+:param:     days, iterable of ints for days to run.
+            parts, iterable of 'a' and/or 'b'.
+            jobs, number of worker processes.
+            timings, dictionary with task keys mapped to seconds.
+            out, stream to write the day ordered report to.
+            progress, stream to write results to as they complete.
+            solve, picklable function taking (day, part) and returning a
+            Result.
+:return:    list of Results in day order.
+'''
+def run_parallel(days, parts, jobs, timings, out=sys.stdout, progress=sys.stderr,
+        solve=runner.run_part):
+    found = runner.tasks( days, parts )
+    done = {}
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor( max_workers = jobs ) as pool:
+        futures = { pool.submit(solve, day, part): (day, part)
+            for day, part in order_tasks(found, timings) }
+
+        for future in as_completed( futures ):
+            result = future.result()
+            done[ futures[future] ] = result
+            progress.write( "done  " + runner.format_result(result) + "\n" )
+            progress.flush()
+    wall = time.perf_counter() - start
+
+    results = [ done[task] for task in found ]
+    for result in results:
+        out.write( runner.format_result(result) + "\n" )
+
+    total = sum( result.seconds for result in results )
+    out.write( "total {0:10.4f}s  wall {1:10.4f}s  jobs {2}\n".format(
+        total, wall, jobs ) )
+    return results
@@ -0,0 +1,8 @@
+'''
+Author:     Griffin Melnick, melnick.griffin@gmail.com
+File:       __init__.py
+Purpose:    Advent of Code 2017, benchmark suite
+            Times every day's 'part_a' / 'part_b' over repeated runs, records
+            the median and peak RSS to JSON, and compares against a baseline.
+            Invoked with 'python -m benchmarks'.
+'''
@@ -0,0 +1,70 @@
+'''
+Author:     Griffin Melnick, melnick.griffin@gmail.com
+File:       __main__.py
+Purpose:    Advent of Code 2017, benchmark entry point
+            USAGE: python -m benchmarks [days] [parts] [--repeat N]
+                       [--output FILE] [--baseline FILE] [--threshold F]
+'''
+
+import argparse
+import sys
+
+from aoc17 import runner
+from aoc17.__main__ import parse_days, parse_parts
+from benchmarks import suite
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+Command line parser builder.
+:return:    argparse.ArgumentParser for the benchmark suite.
+'''
+def build_parser():
+    parser = argparse.ArgumentParser( prog = "benchmarks" )
+    parser.add_argument( "days", nargs = '?', type = parse_days,
+        default = list(runner.DAYS), help = "days such as '1,3,5-9'" )
+    parser.add_argument( "parts", nargs = '?', type = parse_parts,
+        default = runner.PARTS, help = "'a', 'b', or 'ab'" )
+    parser.add_argument( "--repeat", type = int, default = 3,
+        help = "timed runs per part (default 3)" )
+    parser.add_argument( "--output", default = "bench_results.json",
+        help = "JSON file to write results to" )
+    parser.add_argument( "--baseline",
+        help = "JSON file from a previous run to compare against" )
+    parser.add_argument( "--threshold", type = float, default = 0.10,
+        help = "fractional slowdown flagged as a regression (default 0.10)" )
+    return parser
+
+
+'''
+Entry point.
+:param:     argv, list of arguments (defaults to sys.argv).
+:return:    exit status, 1 if any part failed or regressed.
+'''
+def main(argv=None):
+    args = build_parser().parse_args( argv )
+    if ( args.repeat < 1 ):
+        sys.stderr.write( "USAGE: --repeat must be at least 1\n" )
+        return 2
+
+    current = suite.run_suite( args.days, args.parts, args.repeat )
+    suite.dump( current, args.output )
+    status = int( any(entry["error"] for entry in current["results"].values()) )
+
+    if ( args.baseline ):
+        baseline = suite.load( args.baseline )
+        for name, old, new, ratio, flagged in suite.compare(current, baseline,
+                args.threshold):
+            sys.stdout.write( "{0}  {1:10.4f}s -> {2:10.4f}s  x{3:.2f}{4}\n".format(
+                name, old, new, ratio, "  SLOWER" if flagged else "" ) )
+            status = status or int( flagged )
+
+    return status
+
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+if ( __name__ == "__main__" ):
+    sys.exit( main() )
@@ -0,0 +1,152 @@
+'''
+Author:     Griffin Melnick, melnick.griffin@gmail.com
+File:       suite.py
+Purpose:    Advent of Code 2017, benchmark suite
+            Each (day, part) is measured in its own spawned process so that
+            its peak RSS is not inflated by the parts measured before it.
+'''
+
+import json
+import multiprocessing
+import platform
+import resource
+import statistics
+import sys
+import time
+
+from aoc17 import runner
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+Entry for a part that could not be measured.
+:param:     day, int from 1 to 25.
+            part, 'a' or 'b'.
+            err, exception that stopped it.
+:return:    dictionary shaped like the one from 'measure()', with no runs.
+'''
+def failed(day, part, err):
+    return {
+        "day": day,
+        "part": part,
+        "runs": [],
+        "median": 0.0,
+        "peak_rss_kb": 0,
+        "output": "",
+        "error": "{0}: {1}".format( type(err).__name__, err ),
+    }
+
+
+'''
+Measurement run inside the spawned worker.
+:param:     day, int from 1 to 25.
+            part, 'a' or 'b'.
+            repeat, number of timed runs.
+:return:    dictionary with run times, median, peak RSS, answer, and error.
+            A day that fails to import gets an entry from 'failed()'.
+'''
+def measure(day, part, repeat):
+    try:
+        runner.load_day( day )
+    except Exception as err:
+        return failed( day, part, err )
+
+    runs, result = [], None
+    for _ in range(repeat):
+        result = runner.run_part(day, part)
+        runs.append( result.seconds )
+        if ( result.error is not None ):
+            break
+
+    return {
+        "day": day,
+        "part": part,
+        "runs": runs,
+        "median": statistics.median( runs ),
+        "peak_rss_kb": resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss,
+        "output": result.output,
+        "error": result.error,
+    }
+
+
+'''
+Suite runner.
+:param:     days, iterable of ints for days to run.
+            parts, iterable of 'a' and/or 'b'.
+            repeat, number of timed runs per part.
+            out, stream to write progress lines to.
+:return:    dictionary ready to be dumped as JSON.
+'''
+def run_suite(days, parts, repeat, out=sys.stdout):
+    context = multiprocessing.get_context( "spawn" )
+    results = {}
+    for day, part in runner.tasks(days, parts):
+        try:
+            with context.Pool( 1 ) as pool:
+                entry = pool.apply( measure, (day, part, repeat) )
+        except Exception as err:
+            entry = failed( day, part, err )
+
+        name = runner.task_key( day, part )
+        results[name] = entry
+        status = entry["error"] or "ok"
+        out.write( "{0}  median {1:10.4f}s  peak {2:>8} KB  {3}\n".format(
+            name, entry["median"], entry["peak_rss_kb"], status ) )
+        out.flush()
+
+    return {
+        "created": time.strftime( "%Y-%m-%dT%H:%M:%S" ),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+'''
+Baseline comparison.
+:param:     current, suite dictionary from 'run_suite()'.
+            baseline, suite dictionary loaded from a previous run.
+            threshold, allowed fractional slowdown before flagging.
+:return:    list of (key, baseline median, current median, ratio, flagged)
+            for every task present and error free in both.
+'''
+def compare(current, baseline, threshold):
+    rows = []
+    for name, entry in sorted( current["results"].items() ):
+        old = baseline["results"].get( name )
+        if ( old is None or entry["error"] or old["error"] ):
+            continue
+
+        ratio = entry["median"] / old["median"] if ( old["median"] > 0 ) \
+            else float("inf")
+        rows.append( (name, old["median"], entry["median"], ratio,
+            ratio > (1 + threshold)) )
+
+    return rows
+
+
+'''
+JSON loader.
+:param:     path, path to suite JSON file.
+:return:    suite dictionary.
+:throws:    RuntimeError, if file cannot be opened or parsed.
+'''
+def load(path):
+    try:
+        with open( path, 'r' ) as f:
+            return json.load( f )
+    except (OSError, ValueError):
+        raise RuntimeError( "Benchmark file '{0}' could not be read.".format(path) )
+
+
+'''
+JSON writer.
+:param:     suite, suite dictionary.
+            path, path to write to.
+'''
+def dump(suite, path):
+    with open( path, 'w' ) as f:
+        json.dump( suite, f, indent = 2, sort_keys = True )
+        f.write( "\n" )
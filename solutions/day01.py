@@ -6,29 +6,34 @@ Purpose:    Advent of Code 2017, Day 1
             functions to call based on part.
 '''
 
+import loader
+import mmap
 import os
 import sys
 
+CHUNK = 1 << 22
+
 # --------------------------------------------------------------
 # --------------------------------------------------------------
 
 '''
 File reader.
+:param:     path, file to read in place of 'day01.txt', or None.
 :requires:  file 'day01.txt' to exist in 'inputs' subdirectory.
-:returns:   all info from 'day01.txt' as a string.
+:returns:   output of 'parse_captcha()' for the file.
 :throws:    RuntimeError, if file cannot be opened.
 '''
-def read_captcha():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day01.txt"
-    path = os.path.join( pwd, input_file )
+def read_captcha(path=None):
+    return loader.load( "day01.txt", parse_captcha, path )
 
-    try:
-        f = open( path, 'r' )
-    except:
-        raise RuntimeError( "Input file 'day01.txt' could not be opened." )
 
+'''
+Captcha parser.
+:param:     f, file object with the contents of 'day01.txt'.
+:return:    string of digits with surrounding whitespace removed.
+'''
+def parse_captcha(f):
     captcha = f.read().strip()
-    f.close()
 
     return captcha
 
@@ -83,20 +88,129 @@ def half_sum(captcha):
     return total
 
 
+'''
+Every offset summing method, using one FFT autocorrelation per digit.  For
+offset k the sum counts each digit matching the one k places further around
+the circle, so 'next_sum()' is entry 1 and 'half_sum()' is entry n // 2.
+:param:     captcha, the string read in using method 'read_captcha()'
+:throws:    ValueError, if captcha holds anything other than digits
+:returns:   numpy int64 array of length n with the sum for every offset k
+'''
+def offset_sums(captcha):
+    import numpy as np
+
+    digits = np.frombuffer( captcha.encode(), dtype = np.uint8 ).astype( np.int64 ) - 48
+    if ( ((digits < 0) | (digits > 9)).any() ):
+        raise ValueError( "Illegal character found in captcha." )
+
+    full = len( digits )
+    if ( full == 0 ):
+        return np.zeros( 0, dtype = np.int64 )
+
+    # zero padding to a power of two keeps every FFT fast whatever n is, and
+    # turns the circular autocorrelation into a linear one, folded back below
+    size = 1 << ( 2 * full - 1 ).bit_length()
+    power = np.zeros( size // 2 + 1 )
+    for value in range(1, 10):
+        spectrum = np.fft.rfft( (digits == value).astype(np.float64), size )
+        power += value * ( spectrum.real ** 2 + spectrum.imag ** 2 )
+
+    linear = np.rint( np.fft.irfft(power, size)[ :full ] ).astype( np.int64 )
+    sums = linear.copy()
+    sums[1:] += linear[ :0:-1 ]
+    return sums
+
+
+'''
+Circular slice helper for 'stream_sum()'.
+:param:     digits, numpy array of the captcha digits.
+            lo, first index, which may be past the end by less than its length.
+            hi, index after the last, with lo <= hi <= lo + len(digits).
+:returns:   numpy array of digits[lo % n], ..., digits[(hi - 1) % n]; a view
+            unless the range wraps past the end
+'''
+def wrapped(digits, lo, hi):
+    import numpy as np
+
+    full = len( digits )
+    if ( lo >= full ):
+        return digits[ (lo - full):(hi - full) ]
+    elif ( hi <= full ):
+        return digits[ lo:hi ]
+    return np.concatenate( (digits[ lo: ], digits[ :(hi - full) ]) )
+
+
+'''
+Streaming summing method for captchas too large to read into memory.  The
+file is memory-mapped and walked in chunks, each compared with a second view
+of the map shifted by the part's offset, so memory stays bounded by the
+chunk size however large the file is.
+:param:     path, file holding one line of digits.
+            part, 'a' for the next digit, 'b' for the digit halfway around.
+            chunk, digits compared per step.
+:throws:    RuntimeError, if file cannot be opened
+            ValueError, if the file holds anything other than digits
+:returns:   sum using method defined in the given part
+'''
+def stream_sum(path, part, chunk=CHUNK):
+    import numpy as np
+
+    try:
+        f = open( path, 'rb' )
+    except OSError:
+        raise RuntimeError( "Input file '{0}' could not be opened.".format(path) )
+
+    with f:
+        if ( os.fstat(f.fileno()).st_size == 0 ):
+            return 0
+        # the map outlives the file object, and is released with its views
+        data = np.frombuffer( mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ),
+            dtype = np.uint8 )
+
+    start, stop = 0, len( data )
+    while ( start < stop and data[start] <= 32 ):
+        start += 1
+    while ( stop > start and data[stop - 1] <= 32 ):
+        stop -= 1
+
+    digits = data[ start:stop ]
+    full = len( digits )
+    if ( full == 0 ):
+        return 0
+    shift = ( 1 % full ) if ( part == 'a' ) else ( full // 2 )
+
+    total = 0
+    for lo in range(0, full, chunk):
+        hi = min( lo + chunk, full )
+        here = digits[ lo:hi ]
+        if ( ((here < 48) | (here > 57)).any() ):
+            raise ValueError( "Illegal character found in captcha." )
+
+        there = wrapped( digits, (lo + shift), (hi + shift) )
+        matched = here[ here == there ]
+        total += int( matched.sum(dtype = np.int64) ) - 48 * len( matched )
+
+    return total
+
+
 '''
 Runs part 'a' appropriate functions and prints result.
+:param:     data, parsed input as returned by 'read_captcha()', or None
+            to read 'day01.txt'.
 '''
-def part_a():
-    captcha = read_captcha()
+def part_a(data=None):
+    captcha = read_captcha() if ( data is None ) else data
     total = next_sum(captcha)
     print( "The CAPTCHA sum is {0}.".format(total) )
 
 
 '''
 Runs part 'b' appropriate functions and prints result.
+:param:     data, parsed input as returned by 'read_captcha()', or None
+            to read 'day01.txt'.
 '''
-def part_b():
-    captcha = read_captcha()
+def part_b(data=None):
+    captcha = read_captcha() if ( data is None ) else data
     total = half_sum(captcha)
     print( "The CAPTCHA sum is {0}.".format(total) )
 
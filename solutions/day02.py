@@ -6,36 +6,80 @@ Purpose:    Advent of Code 2017, Day 2
             functions to call based on part.
 '''
 
+from collections import Counter
 import itertools
-import os
+import loader
 import sys
 
+BLOCK = 4096
+
 # --------------------------------------------------------------
 # --------------------------------------------------------------
 
 '''
 File reader.
+:param:     path, file to read in place of 'day02.txt', or None.
 :requires:  file 'day02.txt' to exist in 'inputs' subdirectory.
-:returns:   all info from 'day02.txt' as a list of lists.
+:returns:   output of 'parse_spreadsheet()' for the file.
 :throws:    RuntimeError, if file cannot be opened.
 '''
-def read_spreadsheet():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day02.txt"
-    path = os.path.join( pwd, input_file )
+def read_spreadsheet(path=None):
+    return loader.load( "day02.txt", parse_spreadsheet, path )
 
-    try:
-        f = open( path, 'r' )
-    except:
-        raise RuntimeError( "Input file 'day02.txt' could not be opened." )
 
+'''
+Spreadsheet parser.
+:param:     f, file object with the contents of 'day02.txt'.
+:return:    list of lists with the number strings of each row.
+'''
+def parse_spreadsheet(f):
     spreadsheet = []
     for line in f:
         spreadsheet.append( line.strip().split() )
-    f.close()
 
     return spreadsheet
 
 
+'''
+Streaming block reader.  Rows are read a block at a time into one numpy
+array per block, padded to the block's widest row with the padding masked,
+so ragged rows keep their own max and min and memory follows the block size
+rather than the file size.  Meant for spreadsheets far larger than the puzzle
+input; part 'a' keeps the list path, which finishes before numpy could load.
+:param:     path, file to read in place of 'day02.txt', or None.
+            rows, number of rows per block.
+:throws:    RuntimeError, if file cannot be opened.
+            ValueError, if file has illegal letter.
+:returns:   generator of numpy masked arrays, one per block of rows.
+'''
+def stream_blocks(path=None, rows=BLOCK):
+    import numpy as np
+
+    path = loader.locate( "day02.txt", path )
+    try:
+        f = open( path, 'r' )
+    except OSError:
+        raise RuntimeError( "Input file '{0}' could not be opened.".format(path) )
+
+    with f:
+        while True:
+            cells = [ line.split() for line in itertools.islice(f, rows) ]
+            if ( not cells ):
+                break
+
+            try:
+                values = np.array( list( itertools.chain.from_iterable(cells) ),
+                    dtype = np.int64 )
+            except ValueError:
+                raise ValueError( "Illegal letter found in spreadsheet." )
+
+            widths = np.array( [ len(row) for row in cells ], dtype = np.int64 )
+            mask = np.arange( widths.max() ) >= widths[ :, None ]
+            padded = np.zeros( mask.shape, dtype = np.int64 )
+            padded[ ~mask ] = values
+            yield np.ma.masked_array( padded, mask = mask )
+
+
 '''
 List conversion from string to int.
 :param:     spreadsheet, a list of list with strings
@@ -65,6 +109,22 @@ def total_checksum(spreadsheet):
     return checksum
 
 
+'''
+Vectorized checksum over the blocks from 'stream_blocks()', taking max minus
+min across each row of a block at once.
+:param:     blocks, iterable of numpy masked arrays
+:returns:   checksum value of spreadsheet, equal to 'total_checksum()'
+'''
+def masked_checksum(blocks):
+    checksum = 0
+    for block in blocks:
+        if ( block.shape[1] == 0 ):
+            continue
+        spread = block.max( axis = 1 ) - block.min( axis = 1 )
+        checksum += int( spread.filled(0).sum() )
+    return checksum
+
+
 '''
 Row sum finding method using evenly divisible numbers.
 :param:     spreadsheet, a list of lists with ints
@@ -81,21 +141,97 @@ def even_row_sum(spreadsheet):
     return row_sum
 
 
+'''
+Row sum finding method using a divisor index instead of every pair.  Each
+distinct value x either walks its multiples up to the row's largest value
+through a hash set, or tests the larger values directly, whichever is fewer
+steps, so a row of m values over range V takes about O(m log V).
+:param:     spreadsheet, a list of lists with ints
+:requires:  spreadsheet != None, every value > 0
+:throws:    ValueError, if a value is not positive
+:returns:   rowsum value of spreadsheet, equal to 'even_row_sum()'
+'''
+def sieve_row_sum(spreadsheet):
+    row_sum = 0
+    for vals in spreadsheet:
+        counts = Counter( vals )
+        distinct = sorted( counts )
+        if ( not distinct ):
+            continue
+        if ( distinct[0] <= 0 ):
+            raise ValueError( "Row values must be positive." )
+
+        # equal values divide each other once per pair
+        row_sum += sum( c * (c - 1) // 2 for c in counts.values() )
+
+        top = distinct[-1]
+        for i, x in enumerate( distinct ):
+            if ( 2 * x > top ):
+                break
+
+            if ( top // x <= len(distinct) - i ):
+                larger = ( y for y in range( (2 * x), (top + 1), x ) if y in counts )
+            else:
+                larger = ( y for y in distinct[ (i + 1): ] if y % x == 0 )
+            for y in larger:
+                row_sum += counts[x] * counts[y] * ( y // x )
+
+    return row_sum
+
+
+'''
+Vectorized row sum for rows with thousands of columns.  Each distinct value
+is tested against every larger distinct value in one numpy operation.
+:param:     spreadsheet, a list of lists with ints
+:requires:  spreadsheet != None, every value > 0
+:throws:    ValueError, if a value is not positive
+:returns:   rowsum value of spreadsheet, equal to 'even_row_sum()'
+'''
+def vector_row_sum(spreadsheet):
+    import numpy as np
+
+    row_sum = 0
+    for vals in spreadsheet:
+        if ( len(vals) == 0 ):
+            continue
+        distinct, counts = np.unique( np.asarray(vals, dtype = np.int64),
+            return_counts = True )
+        if ( distinct[0] <= 0 ):
+            raise ValueError( "Row values must be positive." )
+
+        row_sum += int( (counts * (counts - 1) // 2).sum() )
+
+        # only values up to half the largest can divide another one
+        stop = int( np.searchsorted(distinct, distinct[-1] // 2, side = "right") )
+        for i in range( stop ):
+            larger = distinct[ (i + 1): ]
+            hit = ( larger % distinct[i] == 0 )
+            if ( hit.any() ):
+                row_sum += int( (counts[i] * counts[ (i + 1): ][hit] *
+                    (larger[hit] // distinct[i])).sum() )
+
+    return row_sum
+
+
 '''
 Runs part 'a' appropriate functions and prints result.
+:param:     data, parsed input as returned by 'read_spreadsheet()', or None
+            to read 'day02.txt'.
 '''
-def part_a():
-    spreadsheet = convert( read_spreadsheet() )
+def part_a(data=None):
+    spreadsheet = convert( read_spreadsheet() if ( data is None ) else data )
     sum = total_checksum(spreadsheet)
     print( "The checksum is {0}.".format(sum) )
 
 
 '''
 Runs part 'b' appropriate functions and prints result.
+:param:     data, parsed input as returned by 'read_spreadsheet()', or None
+            to read 'day02.txt'.
 '''
-def part_b():
-    spreadsheet = convert( read_spreadsheet() )
-    sum = even_row_sum(spreadsheet)
+def part_b(data=None):
+    spreadsheet = convert( read_spreadsheet() if ( data is None ) else data )
+    sum = sieve_row_sum(spreadsheet)
     print( "The row sum is {0}.".format(sum) )
 
 # --------------------------------------------------------------
@@ -6,6 +6,9 @@ Purpose:    Advent of Code 2017, day 3
             functions to call based on part.
 '''
 
+import bisect
+import loader
+import math
 import sys
 
 # --------------------------------------------------------------
@@ -13,44 +16,241 @@ import sys
 
 '''
 File reader method.
+:param:     path, file to read in place of 'day03.txt', or None.
 :requires:  file 'day03.txt' to exist in 'inputs' subdirectory.
-:return:    number in file.
+:return:    output of 'parse_num()' for the file.
 :throws:    RuntimeError, if file cannot be opened.
             ValueError, if number cannot be cast to int.
 '''
-def read_num():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day03.txt"
-    path = os.path.join( pwd, input_file )
+def read_num(path=None):
+    return loader.load( "day03.txt", parse_num, path )
 
-    try:
-        f = open( path, 'r' )
-    except:
-        raise RuntimeError( "Input file 'day03.txt' could not be opened." )
-        return 1
 
+'''
+Number parser.
+:param:     f, file object with the contents of 'day03.txt'.
+:return:    number on the first line.
+:throws:    ValueError, if number cannot be cast to int.
+'''
+def parse_num(f):
     try:
         num = int( f.readline().strip() )
     except ValueError:
         raise ValueError( "Illegal letter found as number." )
         return 1
 
-    f.close()
     return num
 
 
+'''
+Spiral coordinate method.  Square k of the spiral (ring 'k' around square 1)
+ends at (2k + 1)^2 in its bottom right corner, and every side of the ring is
+2k squares long, so a square's ring and side give its coordinate directly.
+:param:     num, square number, starting from 1 at (0, 0).
+:return:    tuple (x, y) of the square, with y increasing upwards.
+:throws:    ValueError, if num is less than 1.
+'''
+def spiral_coord(num):
+    if ( num < 1 ):
+        raise ValueError( "Square numbers start at 1." )
+
+    ring = ( math.isqrt(num - 1) + 1 ) // 2
+    corner = ( 2 * ring + 1 ) ** 2
+    if ( num >= corner - 2 * ring ):
+        return ( ring - (corner - num), -ring )
+    elif ( num >= corner - 4 * ring ):
+        return ( -ring, corner - 3 * ring - num )
+    elif ( num >= corner - 6 * ring ):
+        return ( corner - 5 * ring - num, ring )
+    return ( ring, num - corner + 7 * ring )
+
+
+'''
+Spiral index method, the inverse of 'spiral_coord()'.
+:param:     x, column of the square.
+            y, row of the square, increasing upwards.
+:return:    square number at (x, y).
+'''
+def spiral_index(x, y):
+    ring = max( abs(x), abs(y) )
+    corner = ( 2 * ring + 1 ) ** 2
+    if ( y == -ring ):
+        return corner - ( ring - x )
+    elif ( x == -ring ):
+        return corner - 2 * ring - ( y + ring )
+    elif ( y == ring ):
+        return corner - 4 * ring - ( x + ring )
+    return corner - 7 * ring + y
+
+
+'''
+Distance method.
+:param:     num, square number.
+:return:    Manhattan distance from square num to square 1.
+:throws:    ValueError, if num is less than 1.
+'''
+def spiral_dist(num):
+    x, y = spiral_coord( num )
+    return abs( x ) + abs( y )
+
+
+'''
+Vectorized 'spiral_coord()' for many squares at once.
+:param:     nums, array-like of square numbers.
+:return:    tuple (xs, ys) of numpy int64 arrays.
+:throws:    ValueError, if any number is less than 1.
+'''
+def spiral_coords(nums):
+    import numpy as np
+
+    nums = np.asarray( nums, dtype = np.int64 )
+    if ( (nums < 1).any() ):
+        raise ValueError( "Square numbers start at 1." )
+
+    # float square root, corrected by one either way into an exact isqrt
+    root = np.floor( np.sqrt(nums - 1) ).astype( np.int64 )
+    root -= ( root * root > nums - 1 )
+    root += ( (root + 1) * (root + 1) <= nums - 1 )
+
+    ring = ( root + 1 ) // 2
+    corner = ( 2 * ring + 1 ) ** 2
+    bottom = nums >= corner - 2 * ring
+    left = ~bottom & ( nums >= corner - 4 * ring )
+    top = ~bottom & ~left & ( nums >= corner - 6 * ring )
+
+    xs = np.select( [bottom, left, top], [ring - (corner - nums), -ring,
+        corner - 5 * ring - nums], ring )
+    ys = np.select( [bottom, left, top], [-ring, corner - 3 * ring - nums, ring],
+        nums - corner + 7 * ring )
+    return xs, ys
+
+
+'''
+Vectorized 'spiral_index()' for many coordinates at once.
+:param:     xs, array-like of columns.
+            ys, array-like of rows.
+:return:    numpy int64 array of square numbers.
+'''
+def spiral_indices(xs, ys):
+    import numpy as np
+
+    xs = np.asarray( xs, dtype = np.int64 )
+    ys = np.asarray( ys, dtype = np.int64 )
+    ring = np.maximum( np.abs(xs), np.abs(ys) )
+    corner = ( 2 * ring + 1 ) ** 2
+    return np.select( [ys == -ring, xs == -ring, ys == ring], [
+        corner - (ring - xs), corner - 2 * ring - (ys + ring),
+        corner - 4 * ring - (xs + ring)], corner - 7 * ring + ys )
+
+
+'''
+Vectorized 'spiral_dist()' for many squares at once.
+:param:     nums, array-like of square numbers.
+:return:    numpy int64 array of Manhattan distances to square 1.
+:throws:    ValueError, if any number is less than 1.
+'''
+def spiral_dists(nums):
+    import numpy as np
+
+    xs, ys = spiral_coords( nums )
+    return np.abs( xs ) + np.abs( ys )
+
+
+'''
+Stress test method, filling squares in order with the sum of every filled
+neighbor.
+:param:     num, puzzle input.
+:return:    first value written that is larger than num.
+'''
+def first_larger(num):
+    values = { (0, 0): 1 }
+    square = 1
+    while True:
+        square += 1
+        x, y = spiral_coord( square )
+        value = sum( values.get( (x + dx, y + dy), 0 ) for dx in (-1, 0, 1)
+            for dy in (-1, 0, 1) )
+        if ( value > num ):
+            return value
+        values[ (x, y) ] = value
+
+
+class StressTable:
+
+    # ----------------------------------------------------------
+    # Constructors
+
+    '''
+    Default constructor.
+    :modifies:  self.values, self._grid
+    :effects:   initializes table holding only square 1.
+    '''
+    def __init__(self):
+        self.values = [ 1 ]
+        self._grid = { (0, 0): 1 }
+
+
+    # ----------------------------------------------------------
+    # Modifiers
+
+    '''
+    Extension method, filling the next squares of the spiral.
+    :param:     count, number of squares to fill.
+    :modifies:  self.values, self._grid
+    :effects:   appends each new square's neighbor sum to self.values, which
+                stays sorted since every square touches the one before it.
+    '''
+    def extend(self, count):
+        for _ in range(count):
+            x, y = spiral_coord( len(self.values) + 1 )
+            value = sum( self._grid.get( (x + dx, y + dy), 0 ) for dx in (-1, 0, 1)
+                for dy in (-1, 0, 1) )
+            self._grid[ (x, y) ] = value
+            self.values.append( value )
+
+
+    # ----------------------------------------------------------
+    # Accessors
+
+    '''
+    First value above method.
+    :param:     num, value to search past.
+    :return:    first value in the spiral larger than num.
+    :modifies:  self.values, self._grid
+    :effects:   extends the table one ring at a time only while its last
+                value is not above num, then answers with a binary search.
+    '''
+    def first_above(self, num):
+        while ( self.values[-1] <= num ):
+            ring = ( math.isqrt(len(self.values) - 1) + 1 ) // 2
+            self.extend( (2 * ring + 1) ** 2 - len(self.values) or 8 * (ring + 1) )
+        return self.values[ bisect.bisect_right(self.values, num) ]
+
+
+table = StressTable()
+
+
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_num()', or None
+            to read 'day03.txt'.
 '''
-def part_a():
-    num = read_num()
+def part_a(data=None):
+    num = read_num() if ( data is None ) else data
+    steps = spiral_dist(num)
+    print( "It takes {0} steps to carry the data.".format(steps) )
     return 0
 
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_num()', or None
+            to read 'day03.txt'.
 '''
-def part_b():
-    num = read_num()
+def part_b(data=None):
+    num = read_num() if ( data is None ) else data
+    value = table.first_above(num)
+    print( "The first value larger than the input is {0}.".format(value) )
     return 0
 
 
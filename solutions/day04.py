@@ -8,6 +8,8 @@ Purpose:    Advent of Code 2017, day 4
 
 from collections import Counter
 import itertools
+import loader
+import mmap
 import os
 import sys
 
@@ -16,28 +18,163 @@ import sys
 
 '''
 File reader method.
+:param:     path, file to read in place of 'day04.txt', or None.
 :requires:  file 'day04.txt' to be in directory.
-:return:    list of list with all lines from source.
-:throws:    IOError, if file cannot be opened.
+:return:    output of 'parse_phrases()' for the file.
+:throws:    RuntimeError, if file cannot be opened.
 '''
-def read_file():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day04.txt"
-    path = os.path.join( pwd, input_file )
+def read_file(path=None):
+    return loader.load( "day04.txt", parse_phrases, path )
 
-    try:
-        f = open( path, 'r' )
-    except:
-        raise RuntimeError( "Input file 'day04.txt' could not be opened." )
 
+'''
+Passphrase parser.
+:param:     f, file object with the contents of 'day04.txt'.
+:return:    list of lists with the words of each line.
+'''
+def parse_phrases(f):
     phrases = []
     for line in f:
         words = line.strip().split(' ')
         phrases.append( words )
 
-    f.close()
     return phrases
 
 
+'''
+Streaming phrase reader, for files too large to hold as one list.
+:param:     path, file to read in place of 'day04.txt', or None.
+:return:    generator of lists of words, one per line, split as in
+            'parse_phrases()'.
+:throws:    RuntimeError, if file cannot be opened.
+'''
+def stream_phrases(path=None):
+    path = loader.locate( "day04.txt", path )
+    try:
+        f = open( path, 'r' )
+    except OSError:
+        raise RuntimeError( "Input file '{0}' could not be opened.".format(path) )
+
+    with f:
+        for line in f:
+            yield line.strip().split(' ')
+
+
+'''
+Word signature, equal for two words exactly when they are anagrams.
+:param:     word, string.
+:return:    the word's letters in sorted order.
+'''
+def signature(word):
+    return ''.join( sorted(word) )
+
+
+'''
+Single phrase validation with one pass over a set.
+:param:     words, list of words in the phrase.
+            anagrams, True to reject anagrams as well as repeats.
+:return:    True if no word repeats (or is an anagram of an earlier word).
+'''
+def valid_phrase(words, anagrams=False):
+    seen = set()
+    for word in words:
+        key = signature( word ) if ( anagrams ) else word
+        if ( key in seen ):
+            return False
+        seen.add( key )
+
+    return True
+
+
+'''
+Counts valid phrases in linear time, for either part.
+:param:     phrases, iterable of lists of words, such as 'stream_phrases()'.
+            part, 'a' to reject repeated words, 'b' to reject anagrams.
+:return:    counted number of valid phrases, equal to 'count_no_dups()' or
+            'count_no_anagrams()'.
+'''
+def count_valid(phrases, part):
+    anagrams = ( part == 'b' )
+    return sum( 1 for words in phrases if valid_phrase(words, anagrams) )
+
+
+'''
+Shard boundary method, splitting a file into byte ranges that each start
+just after a newline.
+:param:     path, file to split.
+            shards, number of ranges wanted.
+:return:    list of (start, stop) byte offsets, without empty ranges.
+:throws:    RuntimeError, if file cannot be opened.
+'''
+def shard_bounds(path, shards):
+    try:
+        f = open( path, 'rb' )
+    except OSError:
+        raise RuntimeError( "Input file '{0}' could not be opened.".format(path) )
+
+    with f:
+        size = os.fstat( f.fileno() ).st_size
+        if ( size == 0 ):
+            return []
+
+        with mmap.mmap( f.fileno(), 0, access = mmap.ACCESS_READ ) as mm:
+            cuts = [ 0 ]
+            for i in range(1, max(shards, 1)):
+                at = mm.find( b'\n', max(cuts[-1], (size * i) // shards) )
+                cuts.append( size if ( at == -1 ) else at + 1 )
+            cuts.append( size )
+
+    return [ (lo, hi) for lo, hi in zip(cuts, cuts[1:]) if ( lo < hi ) ]
+
+
+'''
+Single shard counter, run inside a worker.  The file is mapped, and only one
+line at a time is copied out of the map to be split into words.
+:param:     path, file to read.
+            start, byte offset of the shard's first line.
+            stop, byte offset just past the shard's last line.
+            part, 'a' or 'b', as for 'count_valid()'.
+:return:    counted number of valid phrases in the shard.
+'''
+def count_shard(path, start, stop, part):
+    anagrams = ( part == 'b' )
+    valid = 0
+    with open( path, 'rb' ) as f, \
+            mmap.mmap( f.fileno(), 0, access = mmap.ACCESS_READ ) as mm:
+        # shards end on a newline, so reading whole lines never passes stop
+        mm.seek( start )
+        while ( mm.tell() < stop ):
+            words = mm.readline().decode().strip().split(' ')
+            if ( valid_phrase(words, anagrams) ):
+                valid += 1
+
+    return valid
+
+
+'''
+Sharded counter for corpora too large for one process.  The file is split
+on newlines into one byte range per worker, and each worker sends back only
+its count.
+:param:     path, file to read in place of 'day04.txt', or None.
+            part, 'a' or 'b', as for 'count_valid()'.
+            jobs, number of worker processes, or None for one per CPU.
+:return:    counted number of valid phrases, equal to 'count_valid()'.
+:throws:    RuntimeError, if file cannot be opened.
+'''
+def count_sharded(path=None, part='a', jobs=None):
+    path = loader.locate( "day04.txt", path )
+    jobs = jobs or os.cpu_count() or 1
+    bounds = shard_bounds( path, jobs )
+    if ( len(bounds) <= 1 ):
+        return sum( count_shard(path, lo, hi, part) for lo, hi in bounds )
+
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor( max_workers = len(bounds) ) as pool:
+        counts = pool.map( count_shard, itertools.repeat(path), *zip(*bounds),
+            itertools.repeat(part) )
+        return sum( counts )
+
+
 '''
 Counts number of phrases with no duplicates.
 :param:     phrases, list of lists to be analyzed.
@@ -85,19 +222,23 @@ def count_no_anagrams(phrases):
 
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_file()', or None
+            to stream 'day04.txt'.
 '''
-def part_a():
-    phrases = read_file()
-    valid = count_no_dups( phrases )
+def part_a(data=None):
+    phrases = stream_phrases() if ( data is None ) else data
+    valid = count_valid( phrases, 'a' )
     print( "There are {0} valid passphrases.".format( valid ) )
 
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_file()', or None
+            to stream 'day04.txt'.
 '''
-def part_b():
-    phrases = read_file()
-    valid = count_no_anagrams( phrases )
+def part_b(data=None):
+    phrases = stream_phrases() if ( data is None ) else data
+    valid = count_valid( phrases, 'b' )
     print( "There are {0} valid passphrases.".format( valid ) )
 
 
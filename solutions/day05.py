@@ -6,28 +6,35 @@ Purpose:    Advent of Code 2017, day 5
             functions to call based on part.
 '''
 
-import os
+from array import array
+import loader
 import sys
 
+SHIFT = 4
+BLOCK = 1 << SHIFT
+
 # --------------------------------------------------------------
 # --------------------------------------------------------------
 
 '''
 File reader method.
+:param:     path, file to read in place of 'day05.txt', or None.
 :requires:  file 'day05.txt' exist in directory.
-:return:    list of ints will all values from input file.
-:throws:    IOError, if file cannot be opened.
+:return:    output of 'parse_instructions()' for the file.
+:throws:    RuntimeError, if file cannot be opened.
             ValueError, if file contains illegal letter.
 '''
-def read_instructions():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day05.txt"
-    path = os.path.join( pwd, input_file )
+def read_instructions(path=None):
+    return loader.load( "day05.txt", parse_instructions, path )
 
-    try:
-        f = open( path, 'r' )
-    except:
-        raise RuntimeError( "Input file 'day05.txt' could not be opened." )
 
+'''
+Jump offset parser.
+:param:     f, file object with the contents of 'day05.txt'.
+:return:    list of ints with one offset per line.
+:throws:    ValueError, if file contains illegal letter.
+'''
+def parse_instructions(f):
     instructions = []
     for line in f:
         try:
@@ -35,7 +42,6 @@ def read_instructions():
         except ValueError:
             raise ValueError( "Illegal letter found in file." )
 
-    f.close()
     return instructions
 
 
@@ -88,21 +94,142 @@ def follow_strange(instructions):
     return steps
 
 
+'''
+Array-backed jump engine for either part.  The offsets live in an
+'array('l')' copy, and the bounds check and updates are plain local integer
+arithmetic, so mazes with millions of entries stay practical.
+:param:     instructions, iterable of ints with instructions to follow.
+            part, 'a' to always increment, 'b' to decrement offsets of three
+            or more.
+:return:    tuple of (steps taken to exit, final offsets as an array('l')).
+            The instructions passed in are not modified.
+:throws:    OverflowError, if an offset no longer fits a C long.
+'''
+def jump_engine(instructions, part):
+    offsets = array( 'l', instructions )
+    size = len( offsets )
+    steps, i = 0, 0
+
+    if ( part == 'a' ):
+        while ( 0 <= i < size ):
+            val = offsets[i]
+            offsets[i] = val + 1
+            i += val
+            steps += 1
+    else:
+        while ( 0 <= i < size ):
+            val = offsets[i]
+            offsets[i] = ( val - 1 ) if ( val >= 3 ) else ( val + 1 )
+            i += val
+            steps += 1
+
+    return steps, offsets
+
+
+'''
+Block walker for 'settled_engine()', following the part 'b' rule through one
+block of settled offsets.  A settled offset is 2 or 3, and visiting it flips
+it to the other one while moving forward by the old value.
+:param:     state, bitmask of the block, bit j set when offset j is 3.
+            entry, offset into the block the walk starts at.
+:return:    tuple of (new state, exit offset, which is BLOCK or up to two
+            past it, and steps taken inside the block).
+'''
+def walk_block(state, entry):
+    j, count = entry, 0
+    while ( j < BLOCK ):
+        if ( state >> j & 1 ):
+            state ^= 1 << j
+            j += 3
+        else:
+            state |= 1 << j
+            j += 2
+        count += 1
+
+    return state, j, count
+
+
+'''
+Part 'b' engine with settled-prefix skipping.  Once an offset is 2 or 3 it
+only ever alternates between the two, so the front of the maze settles.  The
+maze is cut into blocks of BLOCK offsets; each block whose offsets have all
+settled is kept as a bitmask, and a walk across it is looked up in a table of
+(state, entry) to (state, exit, steps), filled the first time it is needed.
+Steps across settled blocks are added from the table, so the count is exactly
+that of 'follow_strange()'.
+:param:     instructions, iterable of ints with instructions to follow.
+:return:    tuple of (steps taken to exit, final offsets as an array('l')).
+            The instructions passed in are not modified.
+:throws:    OverflowError, if an offset no longer fits a C long.
+'''
+def settled_engine(instructions):
+    offsets = array( 'l', instructions )
+    size = len( offsets )
+    states, table = [], {}
+    steps, i = 0, 0
+
+    # offsets not yet 2 or 3 in the first unsettled block, the 'frontier'
+    frontier = 0
+    pending = sum( 1 for val in offsets[ :BLOCK ] if val not in (2, 3) )
+
+    while ( 0 <= i < size ):
+        k = i >> SHIFT
+        if ( k < frontier ):
+            # each walk leaves its block at most two offsets into the next
+            entry = i & ( BLOCK - 1 )
+            while ( k < frontier ):
+                key = ( states[k] << SHIFT ) | entry
+                hit = table.get( key )
+                if ( hit is None ):
+                    hit = table[key] = walk_block( states[k], entry )
+                states[k], out, count = hit
+                steps += count
+                entry = out - BLOCK
+                k += 1
+            i = ( k << SHIFT ) + entry
+            continue
+
+        val = offsets[i]
+        offsets[i] = ( val - 1 ) if ( val >= 3 ) else ( val + 1 )
+        if ( k == frontier and val not in (2, 3) and offsets[i] in (2, 3) ):
+            pending -= 1
+        i += val
+        steps += 1
+
+        while ( pending == 0 and (frontier + 1) << SHIFT <= size ):
+            start = frontier << SHIFT
+            states.append( sum( 1 << j for j in range(BLOCK)
+                if offsets[start + j] == 3 ) )
+            frontier += 1
+            pending = sum( 1 for val in offsets[ (start + BLOCK):(start + 2 * BLOCK) ]
+                if val not in (2, 3) )
+
+    for k, state in enumerate( states ):
+        for j in range(BLOCK):
+            offsets[ (k << SHIFT) + j ] = 3 if ( state >> j & 1 ) else 2
+
+    return steps, offsets
+
+
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_instructions()', or None
+            to read 'day05.txt'.
 '''
-def part_a():
-    instructions = read_instructions()
-    steps = follow_plain(instructions)
+def part_a(data=None):
+    instructions = read_instructions() if ( data is None ) else data
+    steps, _ = jump_engine(instructions, 'a')
     print( "It takes {0} steps to exit the maze.".format(steps) )
 
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_instructions()', or None
+            to read 'day05.txt'.
 '''
-def part_b():
-    instructions = read_instructions()
-    steps = follow_strange(instructions)
+def part_b(data=None):
+    instructions = read_instructions() if ( data is None ) else data
+    steps, _ = settled_engine(instructions)
     print( "It takes {0} steps to exit the maze.".format(steps) )
 
 
@@ -6,7 +6,7 @@ Purpose:    Advent of Code 2017, day 6
             functions to call based on part.
 '''
 
-import os
+import loader
 import sys
 
 # --------------------------------------------------------------
@@ -14,20 +14,23 @@ import sys
 
 '''
 File reader method.
+:param:     path, file to read in place of 'day06.txt', or None.
 :requires:  file 'day06.txt' exist in directory.
-:return:    list of ints will all values from input file.
-:throws:    IOError, if file cannot be opened.
+:return:    output of 'parse_banks()' for the file.
+:throws:    RuntimeError, if file cannot be opened.
             ValueError, if file contains illegal letter.
 '''
-def read_banks():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day06.txt"
-    path = os.path.join( pwd, input_file )
+def read_banks(path=None):
+    return loader.load( "day06.txt", parse_banks, path )
 
-    try:
-        f = open( path, 'r' )
-    except:
-        raise RuntimeError( "Input file 'day06.txt' could not be opened." )
 
+'''
+Memory bank parser.
+:param:     f, file object with the contents of 'day06.txt'.
+:return:    list of ints with the blocks in each bank.
+:throws:    ValueError, if file contains illegal letter.
+'''
+def parse_banks(f):
     banks = f.readline().strip().split(' ')
     for i in range( len(banks) ):
         try:
@@ -35,16 +38,35 @@ def read_banks():
         except ValueError:
             raise ValueError( "Illegal letter found in file." )
 
-    f.close()
     return banks
 
 
 '''
-Duplicate counting method.
+Single redistribution, handing out the largest bank's blocks with 'divmod()'
+rather than one at a time, so it is O(n) however large the banks are.
+:param:     banks, list or tuple of ints.
+:requires:  banks != None, len(banks) > 0
+:return:    new tuple of banks after one balancing cycle.
+'''
+def redistribute(banks):
+    size = len( banks )
+    maximum = max( banks )
+    curr = banks.index( maximum )
+    share, extra = divmod( maximum, size )
+
+    balanced = [ bank + share for bank in banks ]
+    balanced[ curr ] = share
+    for j in range(1, (extra + 1)):
+        balanced[ (curr + j) % size ] += 1
+
+    return tuple( balanced )
+
+
+'''
+Duplicate counting method, remembering every configuration seen.
 :param:     banks, list of ints needing balancing.
-:requires:  banks != None
+:requires:  banks != None, len(banks) > 0
 :return:    map of steps taken to find duplicate.
-:throws:    IndexError, if list cannot be parsed.
 :modifies:  banks.
 :effects:   applies balancing method and changes values.
 '''
@@ -52,41 +74,72 @@ def find_duplicate(banks):
     cycles = 0
     history = {}
 
-    try:
-        while tuple( banks ) not in history:
-            history[ tuple(banks) ] = cycles
-
-            maximum = max( banks )
-            curr = banks.index( maximum )
-
-            banks[ curr ] = 0
-            while maximum > 0:
-                curr = ( curr + 1 ) % len( banks )
-                banks[ curr ] += 1
-                maximum -= 1
+    state = tuple( banks )
+    while state not in history:
+        history[ state ] = cycles
+        state = redistribute( state )
+        cycles += 1
 
-            cycles += 1
+    banks[:] = state
+    return cycles, (cycles - history[ state ])
 
-    except IndexError as err:
-        raise IndexError( err )
 
-    return cycles, (cycles - history[ tuple(banks) ])
+'''
+Cycle finding method using Brent's algorithm, which keeps two configurations
+at a time instead of every one seen.  Slower than 'find_duplicate()' on
+puzzle sized banks, so the parts do not use it; it is for bank counts whose
+history would not fit in memory.
+:param:     banks, list of ints needing balancing.
+:requires:  banks != None, len(banks) > 0
+:return:    tuple of (cycles before the loop starts, loop length); their sum
+            equals the first value of 'find_duplicate()', and the loop length
+            its second.  The banks passed in are not modified.
+'''
+def find_cycle(banks):
+    start = tuple( banks )
+
+    # find the loop length, doubling the distance the tortoise waits
+    power = length = 1
+    tortoise, hare = start, redistribute( start )
+    while ( tortoise != hare ):
+        if ( power == length ):
+            tortoise = hare
+            power *= 2
+            length = 0
+        hare = redistribute( hare )
+        length += 1
+
+    # walk two configurations a loop length apart until they meet
+    tortoise = hare = start
+    for _ in range(length):
+        hare = redistribute( hare )
+    first = 0
+    while ( tortoise != hare ):
+        tortoise = redistribute( tortoise )
+        hare = redistribute( hare )
+        first += 1
+
+    return first, length
 
 
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_banks()', or None
+            to read 'day06.txt'.
 '''
-def part_a():
-    banks = read_banks()
+def part_a(data=None):
+    banks = read_banks() if ( data is None ) else data
     cycles, diff = find_duplicate(banks)
     print( "It takes {0} cycles to find a duplicate.".format(cycles) )
 
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_banks()', or None
+            to read 'day06.txt'.
 '''
-def part_b():
-    banks = read_banks()
+def part_b(data=None):
+    banks = read_banks() if ( data is None ) else data
     cycles, diff = find_duplicate(banks)
     print( "There are {0} steps between when the pattern is seen, and when it repeats.".format(diff) )
 
@@ -7,8 +7,7 @@ Purpose:    Advent of Code 2017, day 7
 '''
 
 import collections
-import networkx as nx
-import os
+import loader
 import sys
 
 # --------------------------------------------------------------
@@ -16,24 +15,25 @@ import sys
 
 '''
 File reader method.
+:param:     path, file to read in place of 'day07.txt', or None.
 :requires:  file 'day07.txt' to exist in 'inputs' subdirectory.
-:return:    list of strings with bank information.
+:return:    output of 'parse_info()' for the file.
 :throws:    RuntimeError, if file cannot be opened.
 '''
-def read_info():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day07.txt"
-    path = os.path.join( pwd, input_file )
+def read_info(path=None):
+    return loader.load( "day07.txt", parse_info, path )
 
-    try:
-        f = open( path, 'r' )
-    except:
-        raise RuntimeError( "Input file 'day07.txt' could not be opened." )
 
+'''
+Program tower parser.
+:param:     f, file object with the contents of 'day07.txt'.
+:return:    list of strings, one per program line.
+'''
+def parse_info(f):
     info = []
     for line in f:
         info.append( line.strip() )
 
-    f.close()
     return info
 
 
@@ -46,6 +46,8 @@ Graph building method.
             RuntimeError, if node(s) / edge(s) cannot be added to graph.
 '''
 def build_graph(info):
+    import networkx as nx
+
     if ( len(info) < 1 ):
         raise RuntimeError( "Program information does not exist." )
 
@@ -75,6 +77,8 @@ Method to find node that unbalances the graph.
 :return:    necessary weight of node to rebalance graph.
 '''
 def find_unbalance(graph):
+    import networkx as nx
+
     node_weights = {}
     for node in reversed( list(nx.topological_sort(graph)) ):
         total = graph.nodes()[node]["weight"]
@@ -98,18 +102,26 @@ def find_unbalance(graph):
 
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_info()', or None
+            to read 'day07.txt'.
 '''
-def part_a():
-    info = read_info()
+def part_a(data=None):
+    import networkx as nx
+
+    info = read_info() if ( data is None ) else data
     graph = build_graph(info)
     print( "The root node is {0}.".format( list(nx.topological_sort(graph))[0] ) )
 
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_info()', or None
+            to read 'day07.txt'.
 '''
-def part_b():
-    info = read_info()
+def part_b(data=None):
+    import networkx as nx
+
+    info = read_info() if ( data is None ) else data
     graph = build_graph(info)
     weight = find_unbalance(nx.freeze(graph))
     print( "The weight needed to rebalance the graph is {0}.".format(weight) )
@@ -6,7 +6,7 @@ Purpose:    Advent of Code 2017, day 8
             functions to call based on part.
 '''
 
-import os
+import loader
 import sys
 
 # --------------------------------------------------------------
@@ -14,20 +14,23 @@ import sys
 
 '''
 File reader method.
+:param:     path, file to read in place of 'day08.txt', or None.
 :requires:  file 'day08.txt' to exist in 'inputs' subdirectory.
-:return:    list of list with instructions and conditionals.
+:return:    output of 'parse_instructions()' for the file.
 :throws:    RuntimeError, if file cannot be opened.
             RuntimeError, if illegal operation is called in instructions.
 '''
-def read_instructions():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day08.txt"
-    path = os.path.join( pwd, input_file )
+def read_instructions(path=None):
+    return loader.load( "day08.txt", parse_instructions, path )
 
-    try:
-        f = open( path, 'r' )
-    except:
-        raise RuntimeError( "Input file 'day08.txt' could not be opened." )
 
+'''
+Register instruction parser.
+:param:     f, file object with the contents of 'day08.txt'.
+:return:    list of instruction strings, and dictionary with every
+            register named in them mapped to 0.
+'''
+def parse_instructions(f):
     instructions = []
     registers = {}
     for line in f:
@@ -36,7 +39,6 @@ def read_instructions():
         line = line.strip().split()
         registers[ line[0] ], registers[ line[4] ] = 0, 0
 
-    f.close()
     return instructions, registers
 
 
@@ -72,18 +74,22 @@ def modify(instructions, registers, part):
 
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_instructions()', or None
+            to read 'day08.txt'.
 '''
-def part_a():
-    instructions, registers = read_instructions()
+def part_a(data=None):
+    instructions, registers = read_instructions() if ( data is None ) else data
     max_value = modify(instructions, registers, 'a')
     print( "The max value through the registers is {0}.".format( max_value ) )
 
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_instructions()', or None
+            to read 'day08.txt'.
 '''
-def part_b():
-    instructions, registers = read_instructions()
+def part_b(data=None):
+    instructions, registers = read_instructions() if ( data is None ) else data
     max_value = modify(instructions, registers, 'b')
     print( "The max value ever through the registers is {0}.".format( max_value ) )
 
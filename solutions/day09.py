@@ -6,7 +6,7 @@ Purpose:    Advent of Code 2017, day 9
             functions to call based on part.
 '''
 
-import os
+import loader
 import sys
 
 # --------------------------------------------------------------
@@ -14,21 +14,22 @@ import sys
 
 '''
 File reader method.
+:param:     path, file to read in place of 'day09.txt', or None.
 :requires:  file 'day09.txt' to exist in 'inputs' subdirectory.
-:return:    string of groups.
+:return:    output of 'parse_groups()' for the file.
 :throws:    RuntimeError, if file cannot be opened.
 '''
-def read_groups():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day09.txt"
-    path = os.path.join( pwd, input_file )
+def read_groups(path=None):
+    return loader.load( "day09.txt", parse_groups, path )
 
-    try:
-        f = open( path, 'r' )
-    except:
-        raise RuntimeError( "Input file 'day09.txt' could not be opened." )
 
+'''
+Stream parser.
+:param:     f, file object with the contents of 'day09.txt'.
+:return:    string of groups on the first line.
+'''
+def parse_groups(f):
     groups = f.readline().strip()
-    f.close()
 
     return groups
 
@@ -75,18 +76,22 @@ def score_groups(groups, part):
 
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_groups()', or None
+            to read 'day09.txt'.
 '''
-def part_a():
-    groups = read_groups()
+def part_a(data=None):
+    groups = read_groups() if ( data is None ) else data
     score = score_groups(groups, 'a')
     print( "The score of the groups is {0}.".format(score) )
 
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_groups()', or None
+            to read 'day09.txt'.
 '''
-def part_b():
-    groups = read_groups()
+def part_b(data=None):
+    groups = read_groups() if ( data is None ) else data
     g_score = score_groups(groups, 'b')
     print( "The number of non-canceled characters is {0}.".format(g_score) )
 
@@ -6,7 +6,7 @@ Purpose:    Advent of Code 2017, day 10
             functions to call based on part.
 '''
 
-import os
+import loader
 import sys
 
 # --------------------------------------------------------------
@@ -15,32 +15,44 @@ import sys
 '''
 File reader method.
 :part:      determines whether or not the string should be split.
+:param:     path, file to read in place of 'day10.txt', or None.
 :requires:  file 'day10.txt' to exist in 'inputs' subdirectory.
-:return:    string of groups.
+:return:    output of 'parse_lengths()' for part 'a', or of 'parse_chars()'
+            for part 'b'.
 :throws:    RuntimeError, if file cannot be opened.
             ValueError, if illegal letter is found in input.
 '''
-def read_lengths(part):
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day10.txt"
-    path = os.path.join( pwd, input_file )
-
-    try:
-        f = open( path, 'r' )
-    except:
-        raise RuntimeError( "Input file 'day10.txt' could not be opened." )
-
+def read_lengths(part, path=None):
     if ( part == 'a' ):
-        try:
-            lengths = [ int( x ) for x in f.readline().strip().split(',') ]
-        except ValueError:
-            raise ValueError( "Illegal letter found in input file." )
+        return loader.load( "day10.txt", parse_lengths, path )
     else:
-        lengths = f.readline().strip()
+        return loader.load( "day10.txt", parse_chars, path )
+
+
+'''
+Input parser for part 'a' used by 'read_lengths()'.
+:param:     f, file object with the contents of 'day10.txt'.
+:return:    list of ints split on commas.
+:throws:    ValueError, if illegal letter is found in input.
+'''
+def parse_lengths(f):
+    try:
+        lengths = [ int( x ) for x in f.readline().strip().split(',') ]
+    except ValueError:
+        raise ValueError( "Illegal letter found in input file." )
 
-    f.close()
     return lengths
 
 
+'''
+Input parser for part 'b' used by 'read_lengths()'.
+:param:     f, file object with the contents of 'day10.txt'.
+:return:    unsplit string from input file.
+'''
+def parse_chars(f):
+    return f.readline().strip()
+
+
 '''
 List generation method.
 :return:    list of ints numbered 0 to 255.
@@ -111,9 +123,11 @@ def hex_dense(dense):
 
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_lengths()', or None
+            to read 'day10.txt'.
 '''
-def part_a():
-    lengths = read_lengths('a')
+def part_a(data=None):
+    lengths = read_lengths('a') if ( data is None ) else data
     nums = gen_list(256)
     hashed, curr, skip = knot_hash(lengths, nums, 0, 0)
     prod = hashed[0] * hashed[1]
@@ -124,9 +138,11 @@ def part_a():
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_lengths()', or None
+            to read 'day10.txt'.
 '''
-def part_b():
-    lengths = gen_lengths( read_lengths('b') )
+def part_b(data=None):
+    lengths = gen_lengths( read_lengths('b') if ( data is None ) else data )
     nums = gen_list(256)
     curr, skip = 0, 0
     for _ in range(64):
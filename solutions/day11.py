@@ -6,7 +6,7 @@ Purpose:    Advent of Code 2017, day 11
             functions to call based on part.
 '''
 
-import os
+import loader
 import sys
 
 # --------------------------------------------------------------
@@ -15,22 +15,23 @@ import sys
 '''
 File reader method.
 :part:      determines whether or not the string should be split.
+:param:     path, file to read in place of 'day11.txt', or None.
 :requires:  file 'day11.txt' to exist in 'inputs' subdirectory.
-:return:    string of steps.
+:return:    output of 'parse_steps()' for the file.
 :throws:    RuntimeError, if file cannot be opened.
 '''
-def read_steps():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day11.txt"
-    path = os.path.join( pwd, input_file )
+def read_steps(path=None):
+    return loader.load( "day11.txt", parse_steps, path )
 
-    try:
-        f = open( path, 'r' )
-    except:
-        raise RuntimeError( "Input file 'day11.txt' could not be opened." )
 
+'''
+Hex step parser.
+:param:     f, file object with the contents of 'day11.txt'.
+:return:    list of steps split on commas.
+'''
+def parse_steps(f):
     steps = f.readline().strip().split(',')
 
-    f.close()
     return steps
 
 
@@ -80,9 +81,11 @@ def find_dist(final):
 
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_steps()', or None
+            to read 'day11.txt'.
 '''
-def part_a():
-    steps = read_steps()
+def part_a(data=None):
+    steps = read_steps() if ( data is None ) else data
     path = run(steps)
     dist = find_dist( path[ len(path) - 1 ] )
     print( "The distance of the endpoint from the origin is {0}.".format(dist) )
@@ -91,9 +94,11 @@ def part_a():
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_steps()', or None
+            to read 'day11.txt'.
 '''
-def part_b():
-    steps = read_steps()
+def part_b(data=None):
+    steps = read_steps() if ( data is None ) else data
     path = run(steps)
     max_dist = find_dist( path[0] )
     for tup in path[ 1: ]:
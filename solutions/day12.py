@@ -6,8 +6,7 @@ Purpose:    Advent of Code 2017, day 12
             functions to call based on part.
 '''
 
-import networkx as nx
-import os
+import loader
 import sys
 
 # --------------------------------------------------------------
@@ -16,27 +15,28 @@ import sys
 '''
 File reader method.
 :part:      determines whether or not the string should be split.
+:param:     path, file to read in place of 'day12.txt', or None.
 :requires:  file 'day12.txt' to exist in 'inputs' subdirectory.
-:return:    dictionay with nodes mapped to direct connections.
+:return:    output of 'parse_pipes()' for the file.
 :throws:    RuntimeError, if file cannot be opened.
             ValueError, if illegal letter is found in file.
 '''
-def read_pipes():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day12.txt"
-    path = os.path.join( pwd, input_file )
+def read_pipes(path=None):
+    return loader.load( "day12.txt", parse_pipes, path )
 
-    try:
-        f = open( path, 'r' )
-    except:
-        raise RuntimeError( "Input file 'day12.txt' could not be opened." )
-        return 1
 
+'''
+Pipe parser.
+:param:     f, file object with the contents of 'day12.txt'.
+:return:    dictionary with programs mapped to the set of programs they
+            connect to directly.
+'''
+def parse_pipes(f):
     pipes = {}
     for line in f:
         line = line.strip().split("<->")
         pipes[ line[0].strip() ] = set( [ x.strip() for x in line[1].split(',') ] )
 
-    f.close()
     return pipes
 
 
@@ -46,6 +46,8 @@ Graph building method.
 :return:    NetworkX DiGraph built using info from the passed dictionary.
 '''
 def build_graph(pipes):
+    import networkx as nx
+
     graph = nx.DiGraph()
     for key in pipes:
         graph.add_edges_from( [ (key, connect) for connect in pipes[key] ] )
@@ -59,6 +61,8 @@ Counts number of nodes with connections to '0'.
 :throws:    RuntimeError, if '0' node does not exist in graph.
 '''
 def count_connects(graph):
+    import networkx as nx
+
     if ( '0' in graph.nodes() ):
         return sum([ nx.has_path( graph, node, '0' ) for node in graph.nodes() ])
 
@@ -73,14 +77,18 @@ Counts number of groups of nodes in graph.
 :return:    number of groups found.
 '''
 def count_groups(graph):
+    import networkx as nx
+
     return len( list(nx.strongly_connected_component_subgraphs(graph)) )
 
 
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_pipes()', or None
+            to read 'day12.txt'.
 '''
-def part_a():
-    pipes = read_pipes()
+def part_a(data=None):
+    pipes = read_pipes() if ( data is None ) else data
     graph = build_graph(pipes)
     count = count_connects(graph)
     print( "{0} nodes have connections back to node '0'.".format(count) )
@@ -89,9 +97,11 @@ def part_a():
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_pipes()', or None
+            to read 'day12.txt'.
 '''
-def part_b():
-    pipes = read_pipes()
+def part_b(data=None):
+    pipes = read_pipes() if ( data is None ) else data
     graph = build_graph(pipes)
     count = count_groups(graph)
     print( "There are {0} groups of nodes.".format(count) )
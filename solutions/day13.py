@@ -7,7 +7,7 @@ Purpose:    Advent of Code 2017, day 13
 '''
 
 from itertools import count
-import os
+import loader
 import sys
 
 # --------------------------------------------------------------
@@ -15,28 +15,29 @@ import sys
 
 '''
 File reader method.
+:param:     path, file to read in place of 'day13.txt', or None.
 :requires:  file 'day13.txt' to exist in 'inputs' subdirectory.
-:return:    dictionary with layers mapped to depths.
+:return:    output of 'parse_firewall()' for the file.
 :throws:    RuntimeError, if file cannot be opened.
             ValueError, if illegal letter is found in file.
 '''
-def read_firewall():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day13.txt"
-    path = os.path.join( pwd, input_file )
+def read_firewall(path=None):
+    return loader.load( "day13.txt", parse_firewall, path )
 
-    try:
-        f = open( path, 'r' )
-    except:
-        raise RuntimeError( "Input file 'day13.txt' could not be opened." )
-        return 1
 
+'''
+Firewall parser.
+:param:     f, file object with the contents of 'day13.txt'.
+:return:    dictionary with layer depths mapped to scanner ranges.
+:throws:    ValueError, if illegal letter is found in file.
+'''
+def parse_firewall(f):
     lines = [ line.strip().split(": ") for line in f ]
     try:
         firewall = { int(layer): int(depth) for layer, depth in lines }
     except ValueError:
         raise ValueError( "Illegal letter found as depth and/or range." )
 
-    f.close()
     return firewall
 
 
@@ -53,9 +54,11 @@ def check_severity(layer, depth):
 
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_firewall()', or None
+            to read 'day13.txt'.
 '''
-def part_a():
-    firewall = read_firewall()
+def part_a(data=None):
+    firewall = read_firewall() if ( data is None ) else data
     severity = sum( layer * firewall[layer] for layer in firewall if \
         (check_severity(layer, firewall[layer]) == 0) )
     print( "The severity of all catches is {0}.".format(severity) )
@@ -64,9 +67,11 @@ def part_a():
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_firewall()', or None
+            to read 'day13.txt'.
 '''
-def part_b():
-    firewall = read_firewall()
+def part_b(data=None):
+    firewall = read_firewall() if ( data is None ) else data
     offset_time = next( hold for hold in count() if not \
         any(check_severity((hold + layer), firewall[layer]) == 0 for layer in firewall) )
     print( "The offset to move uncaught is {0}.".format(offset_time) )
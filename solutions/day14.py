@@ -7,8 +7,7 @@ Purpose:    Advent of Code 2017, day 14
 '''
 
 import day10
-import networkx as nx
-import os
+import loader
 import sys
 
 # --------------------------------------------------------------
@@ -16,23 +15,23 @@ import sys
 
 '''
 File reader method.
+:param:     path, file to read in place of 'day14.txt', or None.
 :requires:  file 'day14.txt' to exist in 'inputs' subdirectory.
-:return:    string with key from input file.
+:return:    output of 'parse_key()' for the file.
 :throws:    RuntimeError, if file cannot be opened.
 '''
-def read_key():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day14.txt"
-    path = os.path.join( pwd, input_file )
+def read_key(path=None):
+    return loader.load( "day14.txt", parse_key, path )
 
-    try:
-        f = open( path, 'r' )
-    except:
-        raise RuntimeError( "Input file 'day14.txt' could not be opened." )
-        return 1
 
+'''
+Key parser.
+:param:     f, file object with the contents of 'day14.txt'.
+:return:    key string on the first line.
+'''
+def parse_key(f):
     key = f.readline().strip()
 
-    f.close()
     return key
 
 
@@ -80,6 +79,8 @@ Creates NetworkX Graph using hash.
 :return:    NetworkX Graph with node and edges based from hash.
 '''
 def make_graph(hashed_grid):
+    import networkx as nx
+
     graph = nx.Graph()
     for i in range(128):
         for j in range(128):
@@ -104,14 +105,18 @@ Connected component count of graph.
 :return:    number of connected components in graph.
 '''
 def count_groups(graph):
+    import networkx as nx
+
     return nx.number_connected_components(graph)
 
 
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_key()', or None
+            to read 'day14.txt'.
 '''
-def part_a():
-    key = read_key()
+def part_a(data=None):
+    key = read_key() if ( data is None ) else data
     hashed_grid = hash(key)
     filled = count_filled(hashed_grid)
     print( "There are {0} filled squares.".format(filled) )
@@ -120,9 +125,11 @@ def part_a():
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_key()', or None
+            to read 'day14.txt'.
 '''
-def part_b():
-    key = read_key()
+def part_b(data=None):
+    key = read_key() if ( data is None ) else data
     hashed_grid = hash(key)
     graph = make_graph(hashed_grid)
     groups = count_groups(graph)
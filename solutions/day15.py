@@ -1,4 +1,5 @@
-import os
+import loader
+import progress
 import sys
 
 # --------------------------------------------------------------
@@ -6,20 +7,23 @@ import sys
 
 '''
 File reader method.
+:param:     path, file to read in place of 'day15.txt', or None.
 :requires:  file 'day15.txt' to exist in 'inputs' subdirectory.
-:return:    two values taken as generator values from file.
+:return:    output of 'parse_generators()' for the file.
 :throws:    RuntimeError, if file cannot be opened.
             ValueError, if illegal letter is found in file.
 '''
-def read_file():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day15.txt"
-    path = os.path.join( pwd, input_file )
+def read_file(path=None):
+    return loader.load( "day15.txt", parse_generators, path )
 
-    try:
-        f = open( path, 'r' )
-    except:
-        raise RuntimeError( "Input file 'day15.txt' could not be opened." )
-        return 1
+
+'''
+Generator parser.
+:param:     f, file object with the contents of 'day15.txt'.
+:return:    starting values of generators A and B.
+:throws:    ValueError, if illegal letter is found in file.
+'''
+def parse_generators(f):
     try:
         a = int(f.readline().strip().split()[4])
         b = int(f.readline().strip().split()[4])
@@ -80,22 +84,25 @@ def count_matches(ag, bg, part):
     else:
         raise RuntimeError( "Illegal value for part passed." )
 
-    for _ in range(i):
-        a = next( ag )
-        b = next( bg )
+    for block in progress.chunks( i, "day15 count_matches" ):
+        for _ in block:
+            a = next( ag )
+            b = next( bg )
 
-        #if ( "{0:b}".format(a)[-16:] == "{0:b}".format(b)[-16:] ):
-        if ( a & 0xFFFF == b & 0xFFFF ):
-            count += 1
+            #if ( "{0:b}".format(a)[-16:] == "{0:b}".format(b)[-16:] ):
+            if ( a & 0xFFFF == b & 0xFFFF ):
+                count += 1
 
     return count
 
 
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_file()', or None
+            to read 'day15.txt'.
 '''
-def part_a():
-    a, b = read_file()
+def part_a(data=None):
+    a, b = read_file() if ( data is None ) else data
     ag = gen_a(a, 'a')
     bg = gen_b(b, 'a')
     count = count_matches(ag, bg, 'a')
@@ -105,9 +112,11 @@ def part_a():
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_file()', or None
+            to read 'day15.txt'.
 '''
-def part_b():
-    a, b = read_file()
+def part_b(data=None):
+    a, b = read_file() if ( data is None ) else data
     ag = gen_a(a, 'b')
     bg = gen_b(b, 'b')
     count = count_matches(ag, bg, 'b')
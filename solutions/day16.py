@@ -6,7 +6,7 @@ Purpose:    Advent of Code 2017, day 16
             functions to call based on part.
 '''
 
-import os
+import loader
 import sys
 
 memo = {}
@@ -16,23 +16,23 @@ memo = {}
 
 '''
 File reader method.
+:param:     path, file to read in place of 'day16.txt', or None.
 :requires:  file 'day16.txt' to exist in 'inputs' subdirectory.
-:return:    list of dance moves from input.
+:return:    output of 'parse_dance()' for the file.
 :throws:    RuntimeError, if file cannot be opened.
 '''
-def read_dance():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day16.txt"
-    path = os.path.join( pwd, input_file )
+def read_dance(path=None):
+    return loader.load( "day16.txt", parse_dance, path )
 
-    try:
-        f = open( path, 'r' )
-    except:
-        raise RuntimeError( "Input file 'day16.txt' could not be opened." )
-        return 1
 
+'''
+Dance move parser.
+:param:     f, file object with the contents of 'day16.txt'.
+:return:    list of dance moves split on commas.
+'''
+def parse_dance(f):
     dance = f.readline().strip().split(',')
 
-    f.close()
     return dance
 
 
@@ -95,9 +95,11 @@ def sim_dance(dance, letters):
 
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_dance()', or None
+            to read 'day16.txt'.
 '''
-def part_a():
-    dance = read_dance()
+def part_a(data=None):
+    dance = read_dance() if ( data is None ) else data
     programs = gen_programs()
     final = sim_dance(dance, programs)
     print( "The final string after dance is {0}.".format(final) )
@@ -106,9 +108,11 @@ def part_a():
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_dance()', or None
+            to read 'day16.txt'.
 '''
-def part_b():
-    dance = read_dance()
+def part_b(data=None):
+    dance = read_dance() if ( data is None ) else data
     programs = gen_programs()
     final = sim_dance(dance, programs)
     for _ in range(999999999):
@@ -6,7 +6,8 @@ Purpose:    Advent of Code 2017, day 17
             functions to call based on part.
 '''
 
-import os
+import loader
+import progress
 import sys
 
 # --------------------------------------------------------------
@@ -14,27 +15,28 @@ import sys
 
 '''
 File reader method.
+:param:     path, file to read in place of 'day17.txt', or None.
 :requires:  file 'day17.txt' to exist in 'inputs' subdirectory.
-:return:    step value taken from input file.
+:return:    output of 'parse_step()' for the file.
 :throws:    RuntimeError, if file cannot be opened.
             ValueError, is letter found as step value.
 '''
-def read_step():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day17.txt"
-    path = os.path.join( pwd, input_file )
+def read_step(path=None):
+    return loader.load( "day17.txt", parse_step, path )
 
-    try:
-        f = open( path, 'r' )
-    except:
-        raise RuntimeError( "Input file 'day17.txt' could not be opened." )
-        return 1
 
+'''
+Step parser.
+:param:     f, file object with the contents of 'day17.txt'.
+:return:    step value on the first line.
+:throws:    ValueError, if letter found as step value.
+'''
+def parse_step(f):
     try:
         step = int( f.readline().strip() )
     except ValueError:
         raise ValueError( "Illegal letter found as number." )
 
-    f.close()
     return step
 
 
@@ -63,11 +65,12 @@ Track value immediately following '0'.
 '''
 def track_zero(step, moment):
     final, curr = 0, 0
-    for i in range(1, (moment + 1)):
-        pos = (curr + step) % i
-        if ( pos == 0 ):
-            final = i
-        curr = pos + 1
+    for block in progress.chunks( (moment + 1), "day17 track_zero", start = 1 ):
+        for i in block:
+            pos = (curr + step) % i
+            if ( pos == 0 ):
+                final = i
+            curr = pos + 1
 
     return final
 
@@ -82,9 +85,11 @@ def find_post_17(c_buffer):
 
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_step()', or None
+            to read 'day17.txt'.
 '''
-def part_a():
-    step = read_step()
+def part_a(data=None):
+    step = read_step() if ( data is None ) else data
     c_buffer = gen_spinlock(step, 2017)
     post = find_post_17(c_buffer)
     print( "The value immediately succeeding '2017' is {0}.".format(post) )
@@ -93,9 +98,11 @@ def part_a():
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_step()', or None
+            to read 'day17.txt'.
 '''
-def part_b():
-    step = read_step()
+def part_b(data=None):
+    step = read_step() if ( data is None ) else data
     post = track_zero(step, 50000000)
     print( "The value immediately succeeding '0' is {0}.".format(post) )
     return 0
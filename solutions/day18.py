@@ -7,7 +7,7 @@ Purpose:    Advent of Code 2017, day 18
 '''
 
 from collections import defaultdict, deque
-import os
+import loader
 import sys
 
 # --------------------------------------------------------------
@@ -108,22 +108,25 @@ class Registers:
 
 '''
 File reader method.
+:param:     path, file to read in place of 'day18.txt', or None.
 :requires:  file 'day18.txt' to exist in 'inputs' subdirectory.
-:return:    list of lists with instructions in input file.
+:return:    output of 'parse_instructions()' for the file.
 :throws:    RuntimeError, if file cannot be opened.
 '''
-def read_instructions():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day18.txt"
-    path = os.path.join( pwd, input_file )
+def read_instructions(path=None):
+    return loader.load( "day18.txt", parse_instructions, path )
 
-    try:    f = open( path, 'r' )
-    except: raise RuntimeError( "Input file 'day18.txt' could not be opened." )
 
+'''
+Duet instruction parser.
+:param:     f, file object with the contents of 'day18.txt'.
+:return:    list of lists with the fields of each instruction.
+'''
+def parse_instructions(f):
     instructions = []
     for line in f:
         instructions.append( [ block.strip() for block in line.strip().split() ] )
 
-    f.close()
     return instructions
 
 
@@ -222,9 +225,11 @@ def sim_dual(regs, instructions):
 
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_instructions()', or None
+            to read 'day18.txt'.
 '''
-def part_a():
-    instructions = read_instructions()
+def part_a(data=None):
+    instructions = read_instructions() if ( data is None ) else data
     regs = Registers()
     for instr in instructions:
         if ( instr[1].isalpha() ):  regs.add( instr[1] )
@@ -236,9 +241,11 @@ def part_a():
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_instructions()', or None
+            to read 'day18.txt'.
 '''
-def part_b():
-    instructions = read_instructions()
+def part_b(data=None):
+    instructions = read_instructions() if ( data is None ) else data
     regs0, regs1 = Registers(), Registers()
     for instr in instructions:
         if ( instr[1].isalpha() ):
@@ -6,7 +6,7 @@ Purpose:    Advent of Code 2017, day 19
             functions to call based on part.
 '''
 
-import os
+import loader
 import sys
 
 # --------------------------------------------------------------
@@ -14,24 +14,25 @@ import sys
 
 '''
 File reader method.
+:param:     path, file to read in place of 'day19.txt', or None.
 :requires:  file 'day19.txt' to exist in 'inputs' subdirectory.
-:return:    list of strings from input file.
+:return:    output of 'parse_diagram()' for the file.
 :throws:    RuntimeError, if file cannot be opened.
 '''
-def read_diagram():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day19.txt"
-    path = os.path.join( pwd, input_file )
+def read_diagram(path=None):
+    return loader.load( "day19.txt", parse_diagram, path )
 
-    try:
-        f = open( path, 'r' )
-    except:
-        raise RuntimeError( "Input file 'day19.txt' could not be opened." )
 
+'''
+Diagram parser.
+:param:     f, file object with the contents of 'day19.txt'.
+:return:    list of lines, kept unstripped so columns line up.
+'''
+def parse_diagram(f):
     diagram = []
     for line in f:
         diagram.append( line )
 
-    f.close()
     return diagram
 
 
@@ -72,9 +73,11 @@ def follow(diagram):
 
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_diagram()', or None
+            to read 'day19.txt'.
 '''
-def part_a():
-    diagram = read_diagram()
+def part_a(data=None):
+    diagram = read_diagram() if ( data is None ) else data
     path, steps = follow(diagram)
     print( "The packet follows the path {0}.".format(path) )
     return 0
@@ -82,9 +85,11 @@ def part_a():
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_diagram()', or None
+            to read 'day19.txt'.
 '''
-def part_b():
-    diagram = read_diagram()
+def part_b(data=None):
+    diagram = read_diagram() if ( data is None ) else data
     path, steps = follow(diagram)
     print( "The packet takes {0} to follow the path.".format(steps) )
     return 0
@@ -7,8 +7,8 @@ Purpose:    Advent of Code 2017, day 20
 '''
 
 from collections import defaultdict
+import loader
 import math
-import os
 import sys
 
 # --------------------------------------------------------------
@@ -62,20 +62,23 @@ class Particle:
 
 '''
 File reader method.
+:param:     path, file to read in place of 'day20.txt', or None.
 :requires:  file 'day20.txt' to exist in 'inputs' subdirectory.
-:return:    defaultdict with Particles from input.
+:return:    output of 'parse_particles()' for the file.
 :throws:    RuntimeError, if file cannot be opened.
             ValueError, if illegal letter is found in input.
 '''
-def read_particles():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day20.txt"
-    path = os.path.join( pwd, input_file )
+def read_particles(path=None):
+    return loader.load( "day20.txt", parse_particles, path )
 
-    try:
-        f = open( path, 'r' )
-    except:
-        raise RuntimeError( "Input file 'day20.txt' could not be opened." )
 
+'''
+Particle parser.
+:param:     f, file object with the contents of 'day20.txt'.
+:return:    defaultdict with line numbers mapped to Particles.
+:throws:    ValueError, if illegal letter is found in input.
+'''
+def parse_particles(f):
     particles = defaultdict()
     for i, line in enumerate(f):
         line = line.strip().split(", ")
@@ -89,7 +92,6 @@ def read_particles():
 
         particles[i] = Particle(p, v, a)
 
-    f.close()
     return particles
 
 
@@ -142,9 +144,11 @@ def count_remaining(particles):
 
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_particles()', or None
+            to read 'day20.txt'.
 '''
-def part_a():
-    particles = read_particles()
+def part_a(data=None):
+    particles = read_particles() if ( data is None ) else data
     closest = find_closest(particles)
     print( "The particle closest to zero is number {0}.".format(closest) )
     return 0
@@ -152,9 +156,11 @@ def part_a():
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_particles()', or None
+            to read 'day20.txt'.
 '''
-def part_b():
-    particles = read_particles()
+def part_b(data=None):
+    particles = read_particles() if ( data is None ) else data
     remaining = count_remaining(particles)
     print( "There are {0} remaining particles.".format(remaining) )
     return 0
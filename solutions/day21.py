@@ -7,8 +7,7 @@ Purpose:    Advent of Code 2017, day 21
 '''
 
 from collections import defaultdict
-import numpy as np
-import os
+import loader
 import sys
 
 orig_pattern = ".#./..#/###"
@@ -22,21 +21,30 @@ Input parsing helper function.
 :return:    numpy array representation of grid.
 '''
 def make_np(square):
+    import numpy as np
+
     return np.array( [ [pxl == '#' for pxl in line] for line in square.split('/') ] )
 
 
 '''
 File reader method.
+:param:     path, file to read in place of 'day21.txt', or None.
 :requires:  file 'day21.txt' to exist in 'inputs' subdirectory.
-:return:    defaultdict with Particles from input.
+:return:    output of 'parse_data()' for the file.
 :throws:    RuntimeError, if file cannot be opened.
 '''
-def read_data():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day21.txt"
-    path = os.path.join( pwd, input_file )
+def read_data(path=None):
+    return loader.load( "day21.txt", parse_data, path )
 
-    try:    f = open( path, 'r' )
-    except: raise RuntimeError( "Input file 'day21.txt' could not be opened." )
+
+'''
+Enhancement rule parser.
+:param:     f, file object with the contents of 'day21.txt'.
+:return:    defaultdict with the bytes of every flip and rotation of each
+            rule's pattern mapped to its output grid as a numpy array.
+'''
+def parse_data(f):
+    import numpy as np
 
     maps = defaultdict( np.array )
     for line in f.readlines():
@@ -45,7 +53,6 @@ def read_data():
             for rot in range(4):
                 maps[np.rot90(arr, rot).tobytes()] = v
 
-    f.close()
     return maps
 
 
@@ -55,6 +62,8 @@ Grid enhancing method as described in problem.
 :return:    grid after ehancement.
 '''
 def enhance(grid, maps):
+    import numpy as np
+
     size = len(grid)
     div = 2 if ( size % 2 == 0 ) else 3
     assert ( div != None )
@@ -77,10 +86,12 @@ def enhance(grid, maps):
 '''
 Called solving method.
 :param:     part, 'a' or 'b' to determine how many iterations to perform.
+            maps, parsed input as returned by 'read_data()', or None to read
+            'day21.txt'.
 :return:    pixels in grid.
 '''
-def solve(part):
-    maps = read_data()
+def solve(part, maps=None):
+    maps = read_data() if ( maps is None ) else maps
     iters = 5 if ( part == 'a' ) else 18
     assert ( iters != None )
 
@@ -92,18 +103,22 @@ def solve(part):
 
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_data()', or None
+            to read 'day21.txt'.
 '''
-def part_a():
-    pixels = solve('a')
+def part_a(data=None):
+    pixels = solve('a', data)
     print( "There are {0} pixels after 5 iterations.".format(pixels) )
     return 0
 
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_data()', or None
+            to read 'day21.txt'.
 '''
-def part_b():
-    pixels = solve('b')
+def part_b(data=None):
+    pixels = solve('b', data)
     print( "There are {0} pixels after 18 iterations.".format(pixels) )
     return 0
 
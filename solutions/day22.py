@@ -7,7 +7,8 @@ Purpose:    Advent of Code 2017, day 22
 '''
 
 from collections import defaultdict
-import os
+import loader
+import progress
 import sys
 
 statuses = { 0: 'c', 1: 'w', 2: 'i', 3: 'f' }
@@ -19,20 +20,23 @@ to_right = { val: key for key, val in to_left.items() }
 
 '''
 File reader method.
+:param:     path, file to read in place of 'day22.txt', or None.
 :requires:  file 'day22.txt' to exist in 'inputs' subdirectory.
-:return:    list of lists with grid definitions from input.
+:return:    output of 'parse_data()' for the file.
 :throws:    RuntimeError, if file cannot be opened.
 '''
-def read_data():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day22.txt"
-    path = os.path.join( pwd, input_file )
+def read_data(path=None):
+    return loader.load( "day22.txt", parse_data, path )
 
-    try:    f = open( path, 'r' )
-    except: raise RuntimeError( "Input file 'day22.txt' could not be opened." )
 
+'''
+Grid parser.
+:param:     f, file object with the contents of 'day22.txt'.
+:return:    list of lists with the characters of each grid row.
+'''
+def parse_data(f):
     data = [ list( line.strip() ) for line in f ]
 
-    f.close()
     return data
 
 
@@ -85,29 +89,32 @@ Infection simulating method with clean, weakened, infected, and flagged.
 def complex_infection(grid):
     count = 0
     curr_pos, curr_dir = (0, 0), (-1, 0)
-    for _ in range(10000000):
-        if ( statuses[ grid[curr_pos] ] == 'c' ):
-            curr_dir = to_left[ curr_dir ]
-        elif ( statuses[ grid[curr_pos] ] == 'w' ):
-            count += 1
-        elif ( statuses[ grid[curr_pos] ] == 'i' ):
-            curr_dir = to_right[ curr_dir ]
-        elif ( statuses[ grid[curr_pos] ] == 'f' ):
-            curr_dir = to_right[to_right[ curr_dir ]]
-        else:
-            raise RuntimeError( "Illegal status found for node." )
-
-        grid[curr_pos] = ( grid[curr_pos] + 1 ) % 4
-        curr_pos = ( curr_pos[0] + curr_dir[0], curr_pos[1] + curr_dir[1] )
+    for block in progress.chunks( 10000000, "day22 complex_infection" ):
+        for _ in block:
+            if ( statuses[ grid[curr_pos] ] == 'c' ):
+                curr_dir = to_left[ curr_dir ]
+            elif ( statuses[ grid[curr_pos] ] == 'w' ):
+                count += 1
+            elif ( statuses[ grid[curr_pos] ] == 'i' ):
+                curr_dir = to_right[ curr_dir ]
+            elif ( statuses[ grid[curr_pos] ] == 'f' ):
+                curr_dir = to_right[to_right[ curr_dir ]]
+            else:
+                raise RuntimeError( "Illegal status found for node." )
+
+            grid[curr_pos] = ( grid[curr_pos] + 1 ) % 4
+            curr_pos = ( curr_pos[0] + curr_dir[0], curr_pos[1] + curr_dir[1] )
 
     return count
 
 
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_data()', or None
+            to read 'day22.txt'.
 '''
-def part_a():
-    data = read_data()
+def part_a(data=None):
+    data = read_data() if ( data is None ) else data
     grid = init_grid(data)
     bursts = simple_infection(grid)
     print( "{0} bursts result in an infected node.".format(bursts) )
@@ -116,9 +123,11 @@ def part_a():
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_data()', or None
+            to read 'day22.txt'.
 '''
-def part_b():
-    data = read_data()
+def part_b(data=None):
+    data = read_data() if ( data is None ) else data
     grid = init_grid(data)
     bursts = complex_infection(grid)
     print( "{0} bursts result in an infected node.".format(bursts) )
@@ -6,7 +6,7 @@ Purpose:    Advent of Code 2017, day 24
             functions to call based on part.
 '''
 
-import os
+import loader
 import sys
 
 # --------------------------------------------------------------
@@ -14,18 +14,23 @@ import sys
 
 '''
 File reader method.
+:param:     path, file to read in place of 'day24.txt', or None.
 :requires:  file 'day24.txt' to exist in 'inputs' subdirectory.
-:return:    list of tuples with port types.
+:return:    output of 'parse_ports()' for the file.
 :throws:    RuntimeError, if file cannot be opened.
             ValueError, if letter found for port type.
 '''
-def read_ports():
-    pwd, input_file = os.path.dirname( __file__ ), "../inputs/day24.txt"
-    path = os.path.join( pwd, input_file )
+def read_ports(path=None):
+    return loader.load( "day24.txt", parse_ports, path )
 
-    try:    f = open( path, 'r' )
-    except: raise RuntimeError( "Input file 'day24.txt' could not be opened." )
 
+'''
+Component parser.
+:param:     f, file object with the contents of 'day24.txt'.
+:return:    list of tuples with the two port types of each component.
+:throws:    ValueError, if letter found for port type.
+'''
+def parse_ports(f):
     ports = []
     for line in f:
         try:
@@ -33,7 +38,6 @@ def read_ports():
         except ValueError:
             raise ValueError( "Illegal letter found in port types." )
 
-    f.close()
     return ports
 
 
@@ -55,9 +59,11 @@ def build(bridge, ports):
 
 '''
 Run methods associated with part 'a'.
+:param:     data, parsed input as returned by 'read_ports()', or None
+            to read 'day24.txt'.
 '''
-def part_a():
-    ports = read_ports()
+def part_a(data=None):
+    ports = read_ports() if ( data is None ) else data
     bridge = ([], 0)
     strength = max( map( lambda bridge: sum(x + y for x, y in bridge[0]), build(bridge, ports) ) )
     print( "The strongest bridge has a strength of {0}.".format(strength) )
@@ -66,9 +72,11 @@ def part_a():
 
 '''
 Run methods associated with part 'b'.
+:param:     data, parsed input as returned by 'read_ports()', or None
+            to read 'day24.txt'.
 '''
-def part_b():
-    ports = read_ports()
+def part_b(data=None):
+    ports = read_ports() if ( data is None ) else data
     bridge = ([], 0)
 
     length = max( map( lambda bridge: len(bridge[0]), build(bridge, ports) ) )
@@ -5,6 +5,7 @@ Purpose:    Advent of Code 2017, day 25
 '''
 
 from collections import defaultdict
+import progress
 import sys
 
 steps = 12861455
@@ -28,11 +29,12 @@ def follow_yaml():
     tape = defaultdict( int )
     pos, state = 0, 'a'
 
-    for _ in range(steps):
-        val = tape[pos]
-        write, move, state = states[state][val]
-        tape[pos] = write
-        pos += move
+    for block in progress.chunks( steps, "day25 follow_yaml" ):
+        for _ in block:
+            val = tape[pos]
+            write, move, state = states[state][val]
+            tape[pos] = write
+            pos += move
 
     return sum( tape.values() )
 
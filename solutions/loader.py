@@ -0,0 +1,218 @@
+'''
+Author:     Griffin Melnick, melnick.griffin@gmail.com
+File:       loader.py
+Purpose:    Advent of Code 2017, shared input loader
+            Every day's 'read_*' method parses its input through 'load()'.
+            Parsed structures are keyed by the SHA-256 of the input file and
+            of the parser's module sources, kept in an in-process LRU, and
+            pickled to '.aoc17/inputs' so later runs skip parsing altogether.
+'''
+
+from collections import OrderedDict
+import contextlib
+import hashlib
+import io
+import os
+import pickle
+import sys
+
+INPUTS = os.path.normpath( os.path.join( os.path.dirname(__file__), "../inputs" ) )
+SOLUTIONS = os.path.dirname( os.path.abspath(__file__) )
+CACHE = os.path.normpath( os.path.join( os.path.dirname(__file__), "../.aoc17/inputs" ) )
+LRU_SIZE = 32
+
+lru = OrderedDict()
+redirects = {}
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+Code object fingerprint, recursing into nested functions and comprehensions
+since their code objects only repr by address.
+:param:     code, code object.
+:return:    bytes covering the code's bytecode, names, and constants.
+'''
+def code_bytes(code):
+    parts = [ code.co_code, repr( code.co_names ).encode() ]
+    for const in code.co_consts:
+        if ( hasattr(const, "co_code") ):
+            parts.append( code_bytes(const) )
+        else:
+            parts.append( repr( const ).encode() )
+
+    return b"\n".join( parts )
+
+
+'''
+Source files behind a parser: its own module and every module from
+'solutions' that module imports, mirroring 'answers.source_digest()', so
+editing a helper or class the parser builds with also invalidates its output.
+:param:     parse, function taking a file object.
+:return:    sorted list of (module name, file path), empty if the parser's
+            module has no file.
+'''
+def sources(parse):
+    module = sys.modules.get( parse.__module__ )
+    path = getattr( module, "__file__", None )
+    if ( not path ):
+        return []
+
+    found = { module.__name__: path }
+    for value in vars( module ).values():
+        other = getattr( value, "__file__", None )
+        if ( other and os.path.dirname(os.path.abspath(other)) == SOLUTIONS ):
+            found[ value.__name__ ] = other
+
+    return sorted( found.items() )
+
+
+'''
+Parser fingerprint, so editing a parser or anything in its module
+invalidates what it produced.
+:param:     parse, function taking a file object.
+:return:    bytes identifying the parser's name and its module sources, or
+            its compiled code when those cannot be read.
+'''
+def fingerprint(parse):
+    found = [ "{0}.{1}\n".format( parse.__module__, parse.__qualname__ ).encode() ]
+    try:
+        for name, path in sources( parse ):
+            with open( path, 'rb' ) as f:
+                found.append( name.encode() + b"\0" + hashlib.sha256(f.read()).digest() )
+    except OSError:
+        found = found[ :1 ]
+
+    if ( len(found) == 1 ):
+        found.append( code_bytes(parse.__code__) )
+
+    return b"".join( found )
+
+
+'''
+Cache key method.
+:param:     raw, bytes of the input file.
+            parse, function taking a file object.
+:return:    hex digest naming the parsed structure.
+'''
+def cache_key(raw, parse):
+    key = hashlib.sha256( hashlib.sha256(raw).digest() )
+    key.update( fingerprint(parse) )
+    return key.hexdigest()
+
+
+'''
+On-disk cache reader.
+:param:     key, hex digest from 'cache_key()'.
+:return:    pickled bytes, or None if not cached.
+'''
+def read_disk(key):
+    try:
+        with open( os.path.join(CACHE, key + ".pickle"), 'rb' ) as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+'''
+On-disk cache writer.  Failures are ignored, the cache is only a shortcut.
+:param:     key, hex digest from 'cache_key()'.
+            blob, pickled bytes.
+'''
+def write_disk(key, blob):
+    path = os.path.join( CACHE, key + ".pickle" )
+    tmp = "{0}.{1}.tmp".format( path, os.getpid() )
+    try:
+        os.makedirs( CACHE, exist_ok = True )
+        with open( tmp, 'wb' ) as f:
+            f.write( blob )
+        os.replace( tmp, path )
+    except OSError:
+        pass
+
+
+'''
+LRU insertion method.
+:param:     key, hex digest from 'cache_key()'.
+            blob, pickled bytes.
+:modifies:  lru
+:effects:   adds blob and evicts the least recently used entries.
+'''
+def remember(key, blob):
+    lru[key] = blob
+    lru.move_to_end( key )
+    while len( lru ) > LRU_SIZE:
+        lru.popitem( last = False )
+
+
+'''
+Input redirection, used to run a day against another copy of its input.
+:param:     name, file name in the 'inputs' subdirectory, e.g. 'day12.txt'.
+            path, file to read in its place, or None to leave it alone.
+:modifies:  redirects
+:effects:   maps name to path until the block exits.
+'''
+@contextlib.contextmanager
+def redirected(name, path):
+    previous = redirects.get( name )
+    if ( path is not None ):
+        redirects[name] = path
+    try:
+        yield
+    finally:
+        if ( previous is None ):
+            redirects.pop( name, None )
+        else:
+            redirects[name] = previous
+
+
+'''
+Input path lookup, for readers that stream a file instead of loading it.
+:param:     name, file name in the 'inputs' subdirectory, e.g. 'day12.txt'.
+            path, file to read in place of name, or None.
+:return:    path, else any redirection of name, else name in 'inputs'.
+'''
+def locate(name, path=None):
+    return path or redirects.get( name ) or os.path.join( INPUTS, name )
+
+
+'''
+Shared loader.
+:param:     name, file name in the 'inputs' subdirectory, e.g. 'day12.txt'.
+            parse, function taking a file object and returning the parsed
+            structure.
+            path, file to read in place of name, or None to use any
+            redirection and then the 'inputs' subdirectory.
+:return:    freshly unpickled copy of the parsed structure, so callers may
+            modify it freely.
+:throws:    RuntimeError, if file cannot be opened.
+'''
+def load(name, parse, path=None):
+    shown = path or redirects.get( name, name )
+    path = locate( name, path )
+    try:
+        with open( path, 'rb' ) as f:
+            raw = f.read()
+    except OSError:
+        raise RuntimeError( "Input file '{0}' could not be opened.".format(
+            shown) )
+
+    key = cache_key( raw, parse )
+    blob = lru.get( key ) or read_disk( key )
+    if ( blob is not None ):
+        try:
+            data = pickle.loads( blob )
+            remember( key, blob )
+            return data
+        except Exception:
+            pass
+
+    data = parse( io.StringIO(raw.decode(), newline = None) )
+    try:
+        blob = pickle.dumps( data, protocol = pickle.HIGHEST_PROTOCOL )
+    except Exception:
+        return data
+
+    remember( key, blob )
+    write_disk( key, blob )
+    return data
@@ -0,0 +1,90 @@
+'''
+Author:     Griffin Melnick, melnick.griffin@gmail.com
+File:       progress.py
+Purpose:    Advent of Code 2017, progress reporting for long simulation loops
+            A loop over 'range(n)' becomes a loop over 'chunks(n, label)', each
+            chunk being a plain range.  The clock is only read between chunks,
+            and a report with iterations per second and an ETA is written at
+            most once per interval, so the inner loop runs untouched.
+            Reporting is off unless 'AOC17_PROGRESS' is set to an interval in
+            seconds; 'AOC17_METRICS' names a file to append JSON lines to in
+            place of stderr.
+'''
+
+import json
+import os
+import sys
+import time
+
+CHUNK = 1 << 16
+
+# --------------------------------------------------------------
+# --------------------------------------------------------------
+
+'''
+Reporting interval accessor.
+:return:    seconds between reports from 'AOC17_PROGRESS', or None when
+            reporting is off.
+'''
+def interval():
+    try:
+        every = float( os.environ.get("AOC17_PROGRESS", "") )
+    except ValueError:
+        return None
+
+    return every if ( every > 0 ) else None
+
+
+'''
+Single report writer.
+:param:     label, name of the loop, e.g. 'day15 count_matches'.
+            done, iterations finished so far.
+            total, iterations the loop will run.
+            elapsed, seconds since the loop started.
+:effects:   appends a JSON line to 'AOC17_METRICS' if set, otherwise writes
+            one line to stderr.
+'''
+def report(label, done, total, elapsed):
+    rate = done / elapsed if ( elapsed > 0 ) else 0.0
+    eta = (total - done) / rate if ( rate > 0 ) else None
+
+    metrics = os.environ.get( "AOC17_METRICS" )
+    if ( metrics ):
+        line = { "loop": label, "done": done, "total": total,
+            "elapsed": round(elapsed, 3), "rate": round(rate, 1),
+            "eta": None if ( eta is None ) else round(eta, 3) }
+        with open( metrics, 'a' ) as f:
+            f.write( json.dumps(line) + "\n" )
+    else:
+        sys.stderr.write( "{0}: {1}/{2} ({3:.1f}%)  {4:,.0f} it/s  eta {5}\n".format(
+            label, done, total, 100.0 * done / total if ( total ) else 100.0,
+            rate, "?" if ( eta is None ) else "{0:.1f}s".format(eta) ) )
+        sys.stderr.flush()
+
+
+'''
+Chunked range, reporting progress between chunks.
+:param:     stop, end of the range.
+            label, name of the loop used in reports.
+            start, beginning of the range.
+            chunk, iterations per chunk.
+:return:    generator of consecutive ranges covering 'range(start, stop)'.
+            With reporting off it yields the whole range at once.
+'''
+def chunks(stop, label, start=0, chunk=CHUNK):
+    every = interval()
+    if ( every is None ):
+        yield range( start, stop )
+        return
+
+    total = max( 0, stop - start )
+    began = last = time.perf_counter()
+    for lo in range( start, stop, chunk ):
+        yield range( lo, min(lo + chunk, stop) )
+
+        now = time.perf_counter()
+        if ( now - last >= every ):
+            report( label, min(lo + chunk, stop) - start, total, now - began )
+            last = now
+
+    report( label, total, total, time.perf_counter() - began )